@@ -5,58 +5,48 @@ Purpose: Manage alien behavior.
 Date: 11/14/2025
 """
 
-import pygame
-from pygame.sprite import Sprite
-from typing import TYPE_CHECKING
+from pygame import Rect
 
-if TYPE_CHECKING:
-    from alien_fleet import AlienFleet
 
-class Alien(Sprite):
+class Alien:
     """
-    Base class for aliens.
+    Base class for aliens. Holds only position; image, settings and
+    screen bounds are shared through AlienFleet, which also draws it.
     """
-    def __init__(self, fleet: 'AlienFleet', x: float, y: float):
+    __slots__ = ('rect', 'x', 'y')
+
+    def __init__(self, x: float, y: float, size: tuple):
         """
-        Initialize alien: set position, image, settings.
+        Initialize alien at position.
+
+        Args:
+            x (float): X coordinate of alien.
+            y (float): Y coordinate of alien.
+            size (tuple): (w, h) of alien.
         """
-        super().__init__()
-        self.fleet = fleet
-        self.screen = fleet.game.screen
-        self.boundaries = fleet.game.screen.get_rect()
-        self.settings = fleet.game.settings
+        self.rect = Rect((0, 0), size)
+        self.reset(x, y)
 
-        self.image = pygame.image.load(self.settings.alien_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.alien_w, self.settings.alien_h))
+    def reset(self, x: float, y: float):
+        """
+        Move alien to position, for reuse in a new fleet.
 
-        self.rect = self.image.get_rect()
+        Args:
+            x (float): X coordinate of alien.
+            y (float): Y coordinate of alien.
+        """
         self.rect.x = x
         self.rect.y = y
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-    def update(self):
+    def update(self, dx: float):
         """
         Move alien horizontally
+
+        Args:
+            dx (float): Distance to move, signed by fleet direction.
         """
-        temp_speed = self.settings.fleet_speed
-        
-        self.x += temp_speed * self.fleet.fleet_direction
+        self.x += dx
         self.rect.x = self.x
         self.rect.y = self.y
-
-
-    def check_edges(self):
-        """
-        Check if alien has reached screen edge.
-
-        Returns:
-            bool: True if at left or right edge.
-        """
-        return (self.rect.right >= self.boundaries.right or self.rect.left <= self.boundaries.left)
-
-    def draw_alien(self):
-        """
-        Draw alien on screen.
-        """
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
@@ -7,6 +7,9 @@ Date: 11/14/2025
 
 import pygame
 from alien import Alien
+from spatial_hash import SpatialHash
+from fleet_bounds import FleetBounds
+from renderer import round_coord
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,136 +18,113 @@ if TYPE_CHECKING:
 
 class AlienFleet:
     """
-    Manages fleet of alien sprites.
+    Manages fleet of aliens. Fleet holds the shared alien image, settings
+    and screen bounds; aliens hold only their position.
     """    
     def __init__(self, game: 'AlienInvasion'):
         """
-        Initialize the alien fleet.
+        Initialize the alien fleet. Aliens are added by create_fleet.
 
         Args:
             game ('AlienInvasion'): Reference to the main game instance.
         """
         self.game = game
         self.settings = game.settings
-        self.fleet = pygame.sprite.Group()
+        self.renderer = game.renderer
+        self.image = game.assets.load_image(self.settings.alien_file, (self.settings.alien_w, self.settings.alien_h))
+        self.boundaries = game.screen.get_rect()
+        # living aliens; dict keeps creation order, values unused
+        self.fleet = {}
+        self.aliens = []
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
-
-        self.create_fleet()
+        self.grid = SpatialHash(self.settings.alien_w, self.settings.alien_h)
+        self.bounds = FleetBounds()
+        self.last_move = (0, 0)
+        self.layer = None
+        self.layer_origin = (0, 0)
 
     def create_fleet(self):
         """
-        Creates grid of aliens.
+        Creates aliens at positions of cached formation.
         """
-        alien_w = self.settings.alien_w
-        alien_h = self.settings.alien_h
-        screen_h = self.settings.screen_h
-        screen_w = self.settings.screen_w
-        
-        fleet_w, fleet_h = self.calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)
-        x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, fleet_w, fleet_h)
-
-        self._create_rectangle_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
+        self.layer = None
+        settings = self.settings
+        positions = self.game.formations.get(settings.screen_w, settings.screen_h,
+                                             settings.alien_w, settings.alien_h, settings.fleet_pattern)
+        self._place_aliens(positions)
 
-    def _create_rectangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
+    def _place_aliens(self, positions):
         """
-        Builds the shape of fleet.
-
-        Args:
-            alien_w (int): Width of alien.
-            alien_h (int): Height of alien.
-            fleet_w (int): Number of aliens horizontally.
-            fleet_h (int): Number of aliens vertically.
-            x_offset (int): Horizontal offset.
-            y_offset (int): Vertical offset.
-        """
-        for row in range(fleet_h):
-            for col in range(fleet_w):
-                current_x = alien_w * col + x_offset
-                current_y = alien_h * row + y_offset
-                if row % 2 == 1:
-                    if col % 2 == 1:
-                        continue
-                else:
-                    if col % 2 == 0:
-                        continue
-                        
-                self._create_alien(current_x, current_y)
-
-    def calculate_offsets(self, alien_w, alien_h, screen_w, fleet_w, fleet_h):
-        """
-        Calculate offsets
+        Move spare aliens to positions and add them to fleet.
+        Aliens are only created when there are not enough spares.
 
         Args:
-            alien_w (int): Width of alien.
-            alien_h (int): Height of alien.
-            fleet_w (int): Number of aliens horizontally.
-            fleet_h (int): Number of aliens vertically.
-            screen_w (int): Width of screen.
-
-        Returns:
-            tuple: (x_offset, y_offset)
+            positions (tuple): (x, y) of each alien.
         """
-        half_screen = self.settings.screen_h // 2
-        fleet_horizontal_space = fleet_w * alien_w
-        fleet_vertical_space = fleet_h * alien_h
-        x_offset = int((screen_w - fleet_horizontal_space) // 2)
-        y_offset = int((half_screen - fleet_vertical_space) // 2)
-        return x_offset,y_offset
+        spares = [alien for alien in self.aliens if alien not in self.fleet]
+        while len(spares) < len(positions):
+            alien = Alien(0, 0, self.image.get_size())
+            self.aliens.append(alien)
+            spares.append(alien)
+
+        for alien, (x, y) in zip(spares, positions):
+            alien.reset(x, y)
+            self._add_alien(alien)
 
-    def calculate_fleet_size(self, alien_w, screen_w, alien_h, screen_h):     
+    def _add_alien(self, alien: Alien):
         """
-        Determine height and width of fleet
+        Add alien to fleet.
 
         Args:
-            alien_w (int): Width of alien.
-            screen_w (int): Width of screen.
-            alien_h (int): Height of alien.
-            screen_h (int): Height of screen.
-
-        Returns:
-            tuple: (fleet_w, fleet_h) number of aliens horizontally and vertically
+            alien (Alien): Alien placed at its creation position.
         """
-        fleet_w = (screen_w//alien_w)
-        fleet_h = ((screen_h / 2) // alien_h)
+        self.fleet[alien] = None
+        self.grid.insert(alien, alien.rect)
+        self.bounds.add(alien)
 
-        if fleet_w % 2 == 0:
-            fleet_w -= 1
-        else:
-            fleet_w -= 2
-
-        if fleet_h % 2 == 0:
-            fleet_h -= 1
-        else:
-            fleet_h -= 2
-
-
-        return int(fleet_w), int(fleet_h)
-    
-
-    
-    def _create_alien(self, current_x: int, current_y: int):
+    def _check_fleet_edges(self):
         """
-        Create  Alien and add to fleet.
+        Drop and reverse fleet when hitting edge.
+        Only the outermost aliens are checked.
+        """
+        if self.settings.fleet_bounds_debug:
+            self._verify_bounds()
+        left = self.bounds.leftmost()
+        right = self.bounds.rightmost()
+        if left is None:
+            return
+        if self._at_edge(left) or self._at_edge(right):
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
 
-        Args:
-            current_x (int): X coordinate of alien.
-            current_y (int): Y coordinate of alien.
+    def _at_edge(self, alien: Alien):
         """
-        new_alien = Alien(self, current_x, current_y)
+        Check if alien has reached screen edge.
 
-        self.fleet.add(new_alien)
+        Returns:
+            bool: True if at left or right edge.
+        """
+        return alien.rect.right >= self.boundaries.right or alien.rect.left <= self.boundaries.left
 
-    def _check_fleet_edges(self):
+    def _verify_bounds(self):
         """
-        Drop and reverse fleet when hitting edge.
+        Compare cached bounds against a full scan of fleet.
+
+        Raises:
+            RuntimeError: If cached bounds disagree with fleet.
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._drop_alien_fleet()
-                self.fleet_direction *= -1
-                break
+        if len(self.bounds) != len(self.fleet):
+            raise RuntimeError(f'Fleet bounds track {len(self.bounds)} aliens, fleet has {len(self.fleet)}')
+        if not self.fleet:
+            return
+        left = min(alien.rect.left for alien in self.fleet)
+        right = max(alien.rect.right for alien in self.fleet)
+        bottom = max(alien.rect.bottom for alien in self.fleet)
+        cached = (self.bounds.leftmost().rect.left, self.bounds.rightmost().rect.right,
+                  self.bounds.bottommost().rect.bottom)
+        if cached != (left, right, bottom):
+            raise RuntimeError(f'Fleet bounds {cached} != scanned {(left, right, bottom)}')
         
     def _drop_alien_fleet(self):
         """
@@ -152,47 +132,172 @@ class AlienFleet:
         """
         for alien in self.fleet:
             alien.y += self.fleet_drop_speed
+        self.grid.move(0, self.fleet_drop_speed)
+        self.last_move = (self.last_move[0], self.fleet_drop_speed)
 
-    def update_fleet(self):
+    def update_fleet(self, scale=1.0):
         """
         Update fleet position, checking edges and moving
         fleet in current direction.
+
+        Args:
+            scale (float): Tick length relative to a BASE_RATE tick.
         """
+        self.last_move = (0, 0)
         self._check_fleet_edges()
-        self.fleet.update()
+        dx = self.settings.fleet_speed * scale * self.fleet_direction
+        for alien in self.fleet:
+            alien.update(dx)
+        self.grid.move(dx, 0)
+        self.last_move = (dx, self.last_move[1])
+
+    def _draw_offset(self, alpha):
+        """
+        Shift from current fleet position back toward previous tick's.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
+
+        Returns:
+            tuple: (dx, dy) in whole pixels, or None when drawing at current position.
+        """
+        if alpha == 1.0:
+            return None
+        dx, dy = self.last_move
+        return (round_coord((alpha - 1) * dx), round_coord((alpha - 1) * dy))
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """
         Draw all aliens in fleet to screen.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
         """
-        alien: 'Alien'
-        for alien in self.fleet:
-            alien.draw_alien()
+        offset = self._draw_offset(alpha)
+        if self.settings.fleet_layer:
+            self._draw_layer(offset)
+            return
+        image = self.image
+        if offset is None:
+            self.renderer.blits([(image, alien.rect) for alien in self.fleet])
+        else:
+            self.renderer.blits([(image, alien.rect.move(offset)) for alien in self.fleet])
 
-    def check_collisions(self, other_group):
+    def _draw_layer(self, offset):
         """
-        Check for projectile hits.
+        Draw whole fleet as one pre-rendered surface, rebuilding it if stale.
 
         Args:
-            other_group (pygame.sprite.Group): check collisions against.
+            offset (tuple): (dx, dy) interpolation shift, or None.
+        """
+        if self.layer is None:
+            self._build_layer()
+            if self.layer is None:
+                return
+        shift_x, shift_y = self._fleet_shift()
+        if offset:
+            shift_x += offset[0]
+            shift_y += offset[1]
+        self.renderer.blit(self.layer, (self.layer_origin[0] + shift_x, self.layer_origin[1] + shift_y))
 
+    def _build_layer(self):
+        """
+        Render living aliens at their creation positions into one surface.
+        """
+        positions = self._base_positions()
+        if not positions:
+            return
+        left = min(x for x, _ in positions)
+        top = min(y for _, y in positions)
+        right = max(x for x, _ in positions) + self.settings.alien_w
+        bottom = max(y for _, y in positions) + self.settings.alien_h
+        self.layer = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        self.layer.blits([(self.image, (x - left, y - top)) for x, y in positions], False)
+        self.layer_origin = (left, top)
+
+    def _base_positions(self):
+        """
         Returns:
-            dict: Dictionary of collisions returned by pygame.sprite.groupcollide
+            list: (x, y) creation position of each living alien.
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        return list(self.bounds.slots.values())
+
+    def _fleet_shift(self):
+        """
+        Distance fleet has moved since creation.
+
+        Returns:
+            tuple: (dx, dy) in whole pixels.
+        """
+        alien, (base_x, base_y) = next(iter(self.bounds.slots.items()))
+        return (alien.rect.x - base_x, alien.rect.y - base_y)
+
+    def check_collisions(self, arsenal):
+        """
+        Check for projectile hits, removing hit aliens and projectiles.
+        Only aliens in grid cells near each projectile are tested.
+
+        Args:
+            arsenal (Arsenal): Bullets in flight to check collisions against.
+
+        Returns:
+            dict: Alien to list of projectiles, like pygame.sprite.groupcollide.
+        """
+        collisions = {}
+        for bullet in list(arsenal.arsenal):
+            hits = [alien for alien in self.grid.query(bullet.rect)
+                    if alien.rect.colliderect(bullet.rect)]
+            if hits:
+                # groupcollide credits the alien created first (top row, then left)
+                alien = min(hits, key=lambda hit: (hit.rect.y, hit.rect.x))
+                collisions.setdefault(alien, []).append(bullet)
+                arsenal.remove(bullet)
+
+        if collisions:
+            self.layer = None
+        for alien in collisions:
+            del self.fleet[alien]
+            self.grid.remove(alien)
+            self.bounds.remove(alien)
+        return collisions
     
+    def check_ship_collision(self, ship):
+        """
+        Check if any alien overlaps ship.
+
+        Args:
+            ship (Ship): Ship to check.
+
+        Returns:
+            bool: True if collision, else False.
+        """
+        for alien in self.grid.query(ship.rect):
+            if alien.rect.colliderect(ship.rect):
+                return True
+        return False
+
+    def empty_fleet(self):
+        """
+        Remove all aliens.
+        """
+        self.fleet.clear()
+        self.grid.clear()
+        self.bounds.clear()
+        self.last_move = (0, 0)
+        self.layer = None
+
     def check_fleet_bottom(self):
         """
         Check if any alien has reached bottom of screen.
+        Only the lowest row is checked.
 
         Returns:
             bool: True if alien reached bottom, else False.
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.rect.bottom >= self. settings.screen_h:
-                return True
-        return False
+        if self.settings.fleet_bounds_debug:
+            self._verify_bounds()
+        alien = self.bounds.bottommost()
+        return alien is not None and alien.rect.bottom >= self.settings.screen_h
     
     def check_destroyed_status(self):
         """
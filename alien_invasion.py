@@ -5,77 +5,280 @@ Purpose: Run game loop and manage gameplay.
 Date: 11/14/2025
 """
 
+from time import perf_counter
+STARTUP_TIME = perf_counter()
+
+import os
+import random
 import sys
+from argparse import ArgumentParser
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
 import pygame
-from settings import Settings
+from settings import Settings, RESTART_SETTINGS, BASE_RATE
+from settings_watcher import SettingsWatcher
 from game_stats import GameStats
 from ship import Ship
 from arsenal import Arsenal
 from alien_fleet import AlienFleet
-from time import sleep
 from button import Button
 from hud import HUD
+from asset_cache import AssetCache
+from formations import FormationCache
+from sprite_atlas import SpriteAtlas
+from frame_profiler import FrameProfiler
+from renderer import Renderer
+from game_state import GameState
+from replay import InputRecorder
+from sound_manager import SoundManager
 
 class AlienInvasion:
     """
     Manages overall game behavior and loop.
     """
-    def __init__(self):
+    def __init__(self, headless=False, record_file=None, settings=None, persist_scores=None):
         """
         Initialize game, settings, assets, objects.
+
+        Args:
+            headless (bool): Run without a real display or sound.
+            record_file (Path): Save each run's inputs here for replay, or None.
+            settings (Settings): Settings to use, or None for defaults.
+            persist_scores (bool): Save scores and leaderboard as settings say,
+                or never if False. None saves only when not headless.
         """
-        pygame.init()
-        self.settings = Settings()
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.display.init()
+        pygame.font.init()
+        self.settings = settings or Settings()
+        if persist_scores is None:
+            persist_scores = not headless
+        if not persist_scores:
+            self.settings.persist_scores = False
         self.settings.initialize_dynamic_settings()
 
         self.screen = pygame.display.set_mode((self.settings.screen_w, self.settings.screen_h))
         pygame.display.set_caption(self.settings.name)
 
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h))
+        self.assets = AssetCache(self.settings.rle_sprites, self._load_atlas())
+        self.bg = self.assets.load_image(self.settings.bg_file, (self.settings.screen_w, self.settings.screen_h), alpha=False)
+        self.formations = FormationCache()
+        self.renderer = Renderer(self.screen, self.bg, self.settings.render_mode, self.settings.batch_blits)
 
         self.game_stats = GameStats(self)
         self.HUD = HUD(self)
         self.running = True
         self.clock = pygame.time.Clock()
+        self.tick_time = 1 / self.settings.sim_rate
+        self.frame_time = 1 / self.settings.FPS
+        self.accumulator = 0.0
+        self.game_state = GameState()
 
-        pygame.mixer.init()
-        self.laser_sound = pygame.mixer.Sound(self.settings.laser_sound)
-        self.laser_sound.set_volume(0.05)
-
-        self.impact_sound = pygame.mixer.Sound(self.settings.impact_sound)
-        self.impact_sound.set_volume(0.05)
+        self.sounds = SoundManager(self.settings, enabled=not headless and self.settings.sound)
+        self.sounds.load_async()
 
-        self.ship = Ship(self, Arsenal(self))
-        self.alien_fleet = AlienFleet(self)
-        self.alien_fleet.create_fleet
+        self.ship_image = self.assets.load_image(self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h))
+        self.ship = Ship(self.screen.get_rect(), self.ship_image.get_size(), Arsenal(self))
+        self.alien_fleet = self._create_alien_fleet()
         
         self.play_button = Button(self, 'Play')
         self.game_active = False
 
+        self.seed = 0
+        self.fire_pending = False
+        self.recorder = InputRecorder(record_file) if record_file else None
+
+        self.profiler = None
+        if self.settings.profile:
+            self.profiler = FrameProfiler(self.settings.profile_window)
+        self.time_to_first_frame = None
+
+        self.watcher = None
+        if not headless and self.settings.hot_reload and self.settings.preset_source:
+            self.watcher = SettingsWatcher(self.settings, self.settings.reload_interval)
+
+    def _load_atlas(self):
+        """
+        Load packed sprite atlas, if enabled and built (see sprite_atlas.py).
+
+        Returns:
+            SpriteAtlas: Loaded atlas, or None to load sprite files one by one.
+        """
+        if not self.settings.sprite_atlas or not self.settings.atlas_file.exists():
+            return None
+        try:
+            return SpriteAtlas(self.settings.atlas_file)
+        except (pygame.error, OSError, ValueError, KeyError) as e:
+            print(f'Sprite atlas disabled: {e}')
+            return None
+
+    def _finish_startup(self):
+        """
+        Show first frame, report startup time, then build fleet behind Play button.
+        """
+        self._update_screen()
+        self.time_to_first_frame = perf_counter() - STARTUP_TIME
+        print(f'Time to first frame: {self.time_to_first_frame * 1000:.0f} ms')
+        if self.alien_fleet.check_destroyed_status():
+            self.alien_fleet.create_fleet()
+
+    def _create_alien_fleet(self):
+        """
+        Create fleet using engine chosen in settings.
+
+        Returns:
+            AlienFleet: Sprite fleet, or NumPy-backed VectorFleet.
+        """
+        if self.settings.fleet_engine == 'vector':
+            from vector_fleet import VectorFleet
+            return VectorFleet(self)
+        return AlienFleet(self)
+
     def run_game(self):
         """
         Main game loop: handle input, updates, draw screen.
         """
+        self._finish_startup()
+        run_frame = self._run_frame_profiled if self.profiler else self._run_frame
         while self.running:
-            #check for input
-            self._check_events()
-            if self.game_active:
-                #act on input
-                self.ship.update()
-                self.alien_fleet.update_fleet()
-                #check for interactions
-                self._check_collisions()
-            #output result
-            self._update_screen()
-            self.clock.tick(self.settings.FPS)
+            run_frame()
+
+    def _run_frame(self):
+        """
+        Run one frame of the game loop: fixed-rate ticks, then interpolated draw.
+        """
+        #check for input
+        self._check_events()
+        #act on input, check for interactions
+        for _ in range(self._ticks_due()):
+            if not self.game_active:
+                break
+            self._update_game(self.tick_time)
+        self.sounds.flush()
+        #output result
+        self._update_screen(self._interpolation())
+        self.frame_time = self.clock.tick(self.settings.FPS) / 1000
+
+    def _ticks_due(self):
+        """
+        Add frame time to accumulator and take out whole simulation ticks.
+        Frame time is capped so a slow frame can't trigger a catch-up spiral.
+
+        Returns:
+            int: Number of ticks to simulate this frame.
+        """
+        if not self.game_active:
+            self.accumulator = 0.0
+            return 0
+        tick = self.tick_time
+        self.accumulator += min(self.frame_time, tick * self.settings.max_catchup_ticks)
+        ticks = int(self.accumulator / tick)
+        self.accumulator -= ticks * tick
+        return ticks
+
+    def _interpolation(self):
+        """
+        Fraction of a tick between last simulated state and now.
+
+        Returns:
+            float: 0-1 blend from previous to current positions.
+        """
+        if not self.game_active or not self.game_state.is_playing():
+            return 1.0
+        return self.accumulator / self.tick_time
+
+    def _run_frame_profiled(self):
+        """
+        Run one frame of the game loop, timing each phase of each tick.
+        """
+        profiler = self.profiler
+        frame_start = profiler.start_frame()
+        self._check_events()
+        profiler.mark('check_events')
+        for _ in range(self._ticks_due()):
+            if not self.game_active:
+                break
+            self._update_game(self.tick_time, profiler.mark)
+        self.sounds.flush()
+        self._draw_screen(self._interpolation())
+        if self.settings.profile_overlay:
+            self.HUD.draw_profile(profiler)
+        profiler.mark('update_screen')
+        self.renderer.end_frame()
+        profiler.mark('display_flip')
+        profiler.end_frame(frame_start)
+        self.frame_time = self.clock.tick(self.settings.FPS) / 1000
+
+    def step(self, inputs=()):
+        """
+        Advance game logic by one simulation tick without events or drawing.
+
+        Args:
+            inputs (iterable): Actions held this tick: 'left', 'right', 'fire'.
+
+        Returns:
+            bool: True if game still active after tick, else False.
+        """
+        if not self.game_active:
+            return False
+        self.ship.moving_left = 'left' in inputs
+        self.ship.moving_right = 'right' in inputs
+        if 'fire' in inputs:
+            self._fire()
+
+        self._update_game(self.tick_time)
+        return self.game_active
+
+    def _record_tick(self):
+        """
+        Record inputs of this tick for replay.
+        """
+        if self.recorder:
+            inputs = []
+            if self.ship.moving_left:
+                inputs.append('left')
+            if self.ship.moving_right:
+                inputs.append('right')
+            if self.fire_pending:
+                inputs.append('fire')
+            self.recorder.record(inputs)
+
+    def _update_game(self, dt, mark=None):
+        """
+        Advance game state timer, then gameplay if playing. Movement is
+        scaled to tick length, so game speed doesn't depend on sim_rate.
+
+        Args:
+            dt (float): Seconds of game time this tick.
+            mark (callable): Called with each phase name as it ends, e.g.
+                FrameProfiler.mark, or None to skip timing.
+        """
+        self._record_tick()
+        if self.fire_pending:
+            self._fire_bullet()
+        self.game_state.update(dt)
+        self.game_stats.play_time += dt
+        if self.game_state.is_playing():
+            scale = dt * BASE_RATE
+            self.ship.update(self.settings.ship_speed * scale)
+            self.ship.arsenal.update_arsenal(scale)
+            if mark:
+                mark('ship_update')
+            self.alien_fleet.update_fleet(scale)
+            if mark:
+                mark('fleet_update')
+            self._check_collisions()
+            if mark:
+                mark('check_collisions')
 
     def _check_collisions(self):
         """
         Handle collisions for ship, aliens, projectiles.
         """
         # check collisions for ship
-        if self.ship.check_collisions(self.alien_fleet.fleet):
+        if self.ship.check_collisions(self.alien_fleet):
             self._check_game_status()
             # -1 life
 
@@ -84,10 +287,9 @@ class AlienInvasion:
             self._check_game_status()
 
         # check collisions of projectiles and aliens
-        collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)
+        collisions = self.alien_fleet.check_collisions(self.ship.arsenal)
         if collisions:
-            self.impact_sound.play()
-            self.impact_sound.fadeout(500)
+            self.sounds.play('impact')
             self.game_stats.update(collisions)
             self.HUD.update_scores()
 
@@ -97,69 +299,137 @@ class AlienInvasion:
             self.game_stats.update_level()
             self.HUD.update_level()
 
+        # record finished run once this tick's hits are scored
+        if not self.game_active:
+            self.game_stats.record_run()
+            self._save_recording()
+
+    def _save_recording(self):
+        """
+        Save recorded inputs with final score and level.
+        """
+        if self.recorder:
+            self.recorder.save(self.game_stats.score, self.game_stats.level)
+
     def _check_game_status(self):
         """
-        Check ship lives, reset level or end game.
+        Check ship lives, reset level and pause before respawn, or end game.
         """
         if self.game_stats.ships_left > 0:
             self.game_stats.ships_left -= 1
             self._reset_level()
-            sleep(0.5)
+            self.game_state.respawn(self.settings.respawn_delay)
         else:
             self.game_active = False
+            self.game_state.game_over()
         print(self.game_stats.ships_left)
 
     def _reset_level(self):
         """
         Clear projectiles and aliens, recreate fleet.
         """
-        self.ship.arsenal.arsenal.empty()
-        self.alien_fleet.fleet.empty()
+        self.ship.arsenal.empty()
+        self.alien_fleet.empty_fleet()
         self.alien_fleet.create_fleet()
 
-    def restart_game(self):
+    def restart_game(self, seed=None):
         """
-        Restart game: reset stats, HUD, level, ship.
+        Restart game: seed RNG, reset stats, HUD, level, ship.
+
+        Args:
+            seed (int): RNG seed for run, or None for a new random seed.
         """
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        random.seed(self.seed)
+        if self.recorder:
+            self.recorder.start(self.seed, self.settings.preset_values())
         self.settings.initialize_dynamic_settings()
+        self.alien_fleet.fleet_direction = self.settings.fleet_direction
         self.game_stats.reset_stats()
         self.HUD.update_scores()
         self._reset_level()
         self.ship._center_ship()
+        self.fire_pending = False
         self.game_active = True
+        self.game_state.start()
         pygame.mouse.set_visible(False)
 
-    def _update_screen(self):
+    def _update_screen(self, alpha=1.0):
+        """
+        Draw frame and present it.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
+        """
+        self._draw_screen(alpha)
+        self.renderer.end_frame()
+
+    def _draw_screen(self, alpha=1.0):
         """
         Draw background, ship, aliens, HUD, buttons.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
         """
-        self.screen.blit(self.bg, (0,0))       
-        self.ship.draw()   
-        self.alien_fleet.draw()
+        self.renderer.begin_frame()
+        self.ship.arsenal.draw(alpha)
+        self.renderer.blit(self.ship_image, self.ship.draw_position(alpha))
+        self.alien_fleet.draw(alpha)
         self.HUD.draw()
 
         if not self.game_active:
             self.play_button.draw()
             pygame.mouse.set_visible(True)
 
-        pygame.display.flip()
-
     def _check_events(self):
         """
-        Handle keyboard, mouse, quit events.
+        Handle keyboard, mouse, quit events, and settings preset changes.
         """
+        if self.watcher:
+            self._apply_settings(self.watcher.poll())
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
-                self.game_stats.save_scores()
-                pygame.quit()
-                sys.exit()
+                self._quit()
             elif event.type == pygame.KEYDOWN and self.game_active == True:
                 self._check_keydown_events(event)
             elif event.type == pygame.KEYUP:
                 self._check_keyup_events(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._check_button_clicked()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.invalidate()
+
+    def _apply_settings(self, changed):
+        """
+        Push reloaded settings into objects that copied them at startup.
+
+        Args:
+            changed (list): Names of settings that changed.
+        """
+        if not changed:
+            return
+        if 'sim_rate' in changed:
+            self.tick_time = 1 / self.settings.sim_rate
+        if 'render_mode' in changed:
+            self.renderer.mode = self.settings.render_mode
+            self.renderer.invalidate()
+        if 'batch_blits' in changed:
+            self.renderer.flush()
+            self.renderer.batch = [] if self.settings.batch_blits else None
+        if 'fleet_drop_speed' in changed:
+            self.alien_fleet.fleet_drop_speed = self.settings.fleet_drop_speed
+        if 'fleet_layer' in changed:
+            self.alien_fleet.layer = None
+        if 'score_save_delay' in changed:
+            self.game_stats.writer.delay = self.settings.score_save_delay
+        if 'reload_interval' in changed:
+            self.watcher.interval = self.settings.reload_interval
+        if 'hot_reload' in changed and not self.settings.hot_reload:
+            # nothing polls the preset after this, so turning it back on needs a restart
+            self.watcher = None
+        restart = [name for name in changed if name in RESTART_SETTINGS]
+        if restart:
+            print(f'Restart to apply: {", ".join(restart)}')
 
     def _check_button_clicked(self):
         """
@@ -187,18 +457,48 @@ class AlienInvasion:
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = True
         elif event.key == pygame.K_SPACE:
-            if self.ship.fire():
-                self.laser_sound.play()
-                self.laser_sound.fadeout(300)
+            self._fire()
         elif event.key == pygame.K_q:
-            self.running = False
-            self.game_stats.save_scores()
-            pygame.quit()
-            sys.exit()
+            self._quit()
 
+    def _quit(self):
+        """
+        Save scores and profile, close pygame, exit.
+        """
+        self.running = False
+        self._save_recording()
+        self.game_stats.save_scores()
+        self.game_stats.close()
+        if self.profiler and self.settings.profile_file:
+            self.profiler.dump(self.settings.profile_file)
+        pygame.quit()
+        sys.exit()
+
+    def _fire(self):
+        """
+        Request a shot on next tick. Presses before one tick make one shot,
+        so replays, which record fire once per tick, match.
+        """
+        self.fire_pending = True
+
+    def _fire_bullet(self):
+        """
+        Fire bullet and play laser sound, unless waiting to respawn.
+        """
+        self.fire_pending = False
+        if self.game_state.is_playing() and self.ship.fire():
+            self.sounds.play('laser')
 
 
 if __name__ == '__main__':
-    ai = AlienInvasion()
+    parser = ArgumentParser(description='Play Alien Invasion.')
+    parser.add_argument('--record', metavar='FILE', help='save inputs of each run for replay.py')
+    parser.add_argument('--preset', metavar='NAME', help='settings preset name (e.g. low-end, stress) or .json file')
+    args = parser.parse_args()
+    try:
+        settings = Settings(args.preset)
+    except (OSError, ValueError) as e:
+        sys.exit(f'Bad settings preset: {e}')
+    ai = AlienInvasion(record_file=args.record, settings=settings)
     ai.run_game()
 
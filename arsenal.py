@@ -5,7 +5,6 @@ Purpose: Manage bullets fired by ship.
 Date: 11/14/2025
 """
 
-import pygame
 from typing import TYPE_CHECKING
 from bullet import Bullet
 
@@ -15,38 +14,72 @@ if TYPE_CHECKING:
 
 class Arsenal:
     """
-    Manage ammunition fired by ship.
+    Manage ammunition fired by ship. Arsenal holds the shared bullet image
+    and tracks which bullets are in flight; bullets hold only their position.
     """
     def __init__(self, game: 'AlienInvasion'):
         """
-        Initialize arsenal: link game, settings, create bullet group.
+        Initialize arsenal: link game, settings, load bullet image, create bullet pool.
+        Bullets in flight are in arsenal; all bullets are in pool.
         """
         self.game = game
         self.settings = game.settings
-        self.arsenal = pygame.sprite.Group()
+        self.image = game.assets.load_image(self.settings.bullet_file, (self.settings.bullet_w, self.settings.bullet_h))
+        # bullets in flight; dict keeps firing order, values unused
+        self.arsenal = {}
+        self.pool = []
+        self._fill_pool()
 
-    def update_arsenal(self):
+    def _fill_pool(self):
+        """
+        Grow pool to bullet_amount bullets.
+        """
+        while len(self.pool) < self.settings.bullet_amount:
+            self.pool.append(Bullet(self.image.get_size()))
+
+    def update_arsenal(self, scale=1.0):
         """
         Update position of bullets, remove off-screen bullets.
+
+        Args:
+            scale (float): Tick length relative to a BASE_RATE tick.
         """
-        self.arsenal.update()
+        speed = self.settings.bullet_speed * scale
+        for bullet in self.arsenal:
+            bullet.update(speed)
         self._remove_bullets_offscreen()
 
     def _remove_bullets_offscreen(self):
         """
-        Remove bullets off the top of screen.
+        Return bullets off the top of screen to pool.
+        """
+        for bullet in [bullet for bullet in self.arsenal if bullet.rect.bottom <= 0]:
+            self.remove(bullet)
+
+    def remove(self, bullet):
+        """
+        Return bullet in flight to pool.
+
+        Args:
+            bullet (Bullet): Bullet to remove.
         """
-        for bullet in self.arsenal.copy():
-            if bullet.rect.bottom <= 0:
-                self.arsenal.remove(bullet)
-        
+        del self.arsenal[bullet]
 
-    def draw(self):
+    def empty(self):
+        """
+        Return all bullets in flight to pool.
+        """
+        self.arsenal.clear()
+
+    def draw(self, alpha=1.0):
         """
         Draw bullets to screen.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        image = self.image
+        self.game.renderer.blits([(image, bullet.draw_position(alpha)) for bullet in self.arsenal])
     
     def fire_bullet(self):
         """
@@ -56,9 +89,10 @@ class Arsenal:
             bool: True if bullet fired, else False.
         """
         if len(self.arsenal) < self.settings.bullet_amount:
-            new_bullet = Bullet(self.game)
-            self.arsenal.add(new_bullet)
-            return True
+            self._fill_pool()
+            for bullet in self.pool:
+                if bullet not in self.arsenal:
+                    bullet.fire(self.game.ship.rect.midtop)
+                    self.arsenal[bullet] = None
+                    return True
         return False
-        
-        
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Program Name: asset_cache.py
+Author: Jack Curcillo
+Purpose: Load, scale, convert, and share image surfaces.
+Date: 11/14/2025
+"""
+
+from pathlib import Path
+import pygame
+
+#colors tried as colorkey for palette images whose key color is also used by visible pixels
+KEY_COLORS = ((255, 0, 255), (0, 255, 0), (1, 2, 3))
+
+
+class AssetCache:
+    """
+    Shared image cache keyed by (path, size, transform, alpha).
+    Sprites found in the atlas at the requested size are sliced from it
+    instead of decoded from their own files.
+    """
+    def __init__(self, rle=False, atlas=None):
+        """
+        Init empty surface cache and hit/miss counters.
+
+        Args:
+            rle (bool): RLE-accelerate colorkeyed sprites when converting.
+            atlas (SpriteAtlas): Packed sprites to slice from, or None.
+        """
+        self.rle = rle
+        self.atlas = atlas
+        self.atlas_keys = {}
+        self.surfaces = {}
+        self.converted = set()
+        self.hits = 0
+        self.misses = 0
+
+    def load_image(self, path, size=None, transform='scale', alpha=True):
+        """
+        Load an image once and share the resulting surface.
+
+        Args:
+            path (Path): Image file to load.
+            size (tuple): (w, h) to scale to, or None to keep original size.
+            transform (str): 'scale' or 'smoothscale'.
+            alpha (bool): Keep per-pixel alpha (sprites) or make opaque (backgrounds).
+
+        Returns:
+            pygame.Surface: Shared surface for this key.
+        """
+        key = (str(path), tuple(size) if size else None, transform, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        atlas_key = (Path(path).resolve(), key[1])
+        # atlas sprites were packed with plain scale
+        if alpha and transform == 'scale' and self.atlas and atlas_key in self.atlas:
+            self.atlas_keys[key] = atlas_key
+            self.surfaces[key] = self.atlas.get(atlas_key)
+            if pygame.display.get_surface() is not None:
+                return self._convert(key)
+            return self.surfaces[key]
+
+        surface = pygame.image.load(path)
+        if size:
+            if transform == 'smoothscale':
+                surface = pygame.transform.smoothscale(surface, size)
+            else:
+                surface = pygame.transform.scale(surface, size)
+        self.surfaces[key] = surface
+        if pygame.display.get_surface() is not None:
+            surface = self._convert(key)
+        return surface
+
+    def _convert(self, key):
+        """
+        Convert one cached surface to the display format. Colorkeyed images
+        keep their colorkey (RLE-accelerated if enabled); per-pixel alpha
+        images keep their alpha.
+
+        Args:
+            key (tuple): Cache key of surface.
+
+        Returns:
+            pygame.Surface: Converted surface.
+        """
+        if key in self.atlas_keys:
+            # convert whole atlas once so sprites keep sharing its pixels
+            self.atlas.convert()
+            surface = self.atlas.get(self.atlas_keys[key])
+            self.surfaces[key] = surface
+            self.converted.add(key)
+            return surface
+
+        surface = self.surfaces[key]
+        alpha = key[3]
+        # convert_alpha drops the colorkey, so read it first
+        colorkey = surface.get_colorkey()
+        if colorkey is not None and surface.get_bitsize() <= 8:
+            surface = self._convert_palette_keyed(surface)
+        elif colorkey is not None:
+            surface = surface.convert()
+            surface.set_colorkey(colorkey, pygame.RLEACCEL if self.rle else 0)
+        elif alpha:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+
+        self.surfaces[key] = surface
+        self.converted.add(key)
+        return surface
+
+    def _convert_palette_keyed(self, surface):
+        """
+        Convert colorkeyed palette image. Its key is one palette entry, but other
+        entries may share that color, so transparent pixels are re-keyed with a
+        color no visible pixel uses.
+
+        Args:
+            surface (pygame.Surface): Palette surface with colorkey.
+
+        Returns:
+            pygame.Surface: Converted surface with colorkey, or per-pixel alpha
+                if every key color is taken.
+        """
+        # blitting onto a clear surface applies the palette key exactly
+        keyed = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        keyed.blit(surface, (0, 0))
+        for color in KEY_COLORS:
+            if not pygame.mask.from_threshold(keyed, color + (255,), (1, 1, 1, 1)).count():
+                converted = pygame.Surface(surface.get_size()).convert()
+                converted.fill(color)
+                converted.blit(keyed, (0, 0))
+                converted.set_colorkey(color, pygame.RLEACCEL if self.rle else 0)
+                return converted
+        return keyed.convert_alpha()
+
+    def clear(self):
+        """
+        Drop all cached surfaces and reset counters.
+        """
+        self.surfaces.clear()
+        self.converted.clear()
+        self.atlas_keys.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Report cache usage.
+
+        Returns:
+            dict: hits, misses, number of cached surfaces, and how many came from atlas.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'surfaces': len(self.surfaces),
+            'atlas': len(self.atlas_keys)
+        }
@@ -0,0 +1,492 @@
+"""
+Program Name: benchmark.py
+Author: Jack Curcillo
+Purpose: Measure performance of game systems and write a JSON report.
+Date: 11/14/2025
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import mean, median
+from types import SimpleNamespace
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from settings import Settings
+from asset_cache import AssetCache
+from alien_fleet import AlienFleet
+from alien_invasion import AlienInvasion
+from arsenal import Arsenal
+from bullet import Bullet
+from alien import Alien
+from renderer import Renderer
+from formations import FormationCache
+from sprite_atlas import SpriteAtlas, sprite_sizes
+
+SCREEN_SIZES = ((800, 600), (1200, 800), (1920, 1080))
+ALIEN_SIZES = (60, 30, 15)
+BULLET_COUNTS = (5, 50, 500)
+
+
+def _timings(run, repeat, setup=None):
+    """
+    Time run() repeat times, calling setup() untimed before each run.
+
+    Args:
+        run (callable): Code to time.
+        repeat (int): Number of timed runs.
+        setup (callable): Untimed preparation before each run, or None.
+
+    Returns:
+        dict: mean/median/min ms and number of runs.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'mean_ms': mean(samples),
+        'median_ms': median(samples),
+        'min_ms': min(samples),
+        'runs': repeat
+    }
+
+
+def _make_settings(screen_size=(1200, 800), alien_size=60, **overrides):
+    """
+    Build benchmark settings that never touch saved scores.
+
+    Args:
+        screen_size (tuple): (w, h) of screen.
+        alien_size (int): Alien width and height.
+        overrides: Other settings to change.
+
+    Returns:
+        Settings: Configured settings.
+    """
+    settings = Settings()
+    settings.screen_w, settings.screen_h = screen_size
+    settings.alien_w = settings.alien_h = alien_size
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return settings
+
+
+def _make_game(settings):
+    """
+    Build minimal stand-in for AlienInvasion: settings, screen, assets.
+
+    Args:
+        settings (Settings): Settings to use.
+
+    Returns:
+        SimpleNamespace: Object with settings, screen, assets, formations, renderer.
+    """
+    screen = pygame.display.set_mode((settings.screen_w, settings.screen_h))
+    renderer = Renderer(screen, screen.copy())
+    return SimpleNamespace(settings=settings, screen=screen, assets=AssetCache(),
+                           formations=FormationCache(), renderer=renderer)
+
+
+def _headless_game(screen_size=(1200, 800), alien_size=60, **overrides):
+    """
+    Build headless game in play.
+
+    Returns:
+        AlienInvasion: Game with restart_game() already called.
+    """
+    game = AlienInvasion(headless=True, settings=_make_settings(screen_size, alien_size, **overrides))
+    game.restart_game(seed=0)
+    return game
+
+
+def bench_create_fleet(screen_size, alien_size, repeat):
+    """
+    Time AlienFleet.create_fleet on an empty fleet.
+    """
+    fleet = _headless_game(screen_size, alien_size).alien_fleet
+    result = _timings(fleet.create_fleet, repeat, fleet.empty_fleet)
+    result['aliens'] = len(fleet.fleet)
+    return result
+
+
+def bench_update_fleet(screen_size, alien_size, repeat):
+    """
+    Time AlienFleet.update_fleet.
+    """
+    fleet = _headless_game(screen_size, alien_size).alien_fleet
+    result = _timings(fleet.update_fleet, repeat)
+    result['aliens'] = len(fleet.fleet)
+    return result
+
+
+def bench_check_collisions(bullets, alien_size, repeat):
+    """
+    Time AlienFleet.check_collisions with bullets spread over fleet area.
+    """
+    game = _headless_game(alien_size=alien_size)
+    game.settings.bullet_amount = bullets
+    fleet = game.alien_fleet
+    arsenal = game.ship.arsenal
+    rng = random.Random(0)
+
+    def setup():
+        fleet.empty_fleet()
+        fleet.create_fleet()
+        arsenal.empty()
+        for _ in range(bullets):
+            arsenal.fire_bullet()
+        for bullet in arsenal.arsenal:
+            bullet.rect.midtop = (rng.randrange(game.settings.screen_w), rng.randrange(game.settings.screen_h // 2))
+
+    return _timings(lambda: fleet.check_collisions(arsenal), repeat, setup)
+
+
+def bench_fire_bullet(repeat):
+    """
+    Time Arsenal.fire_bullet + off-screen recycling churn.
+    """
+    game = _headless_game()
+    arsenal = game.ship.arsenal
+
+    def churn():
+        arsenal.fire_bullet()
+        for bullet in arsenal.arsenal:
+            bullet.y = -game.settings.bullet_h - 1
+        arsenal.update_arsenal()
+
+    return _timings(churn, repeat)
+
+
+def bench_hud_update_scores(repeat):
+    """
+    Time HUD.update_scores when score changes each call.
+    """
+    game = _headless_game()
+    stats = game.game_stats
+
+    def score():
+        stats.score += game.settings.alien_points
+        game.HUD.update_scores()
+
+    return _timings(score, repeat)
+
+
+def bench_render_frame(screen_size, alien_size, repeat, render_mode='flip'):
+    """
+    Time one full frame: draw and present.
+    """
+    game = _headless_game(screen_size, alien_size, render_mode=render_mode)
+    game._update_screen()
+    result = _timings(game._update_screen, repeat, lambda: game.step(('right',)))
+    result['aliens'] = len(game.alien_fleet.fleet)
+    return result
+
+
+def bench_blit_conversion(frames=200):
+    """
+    Time one frame of background + fleet blits with raw vs converted surfaces.
+
+    Args:
+        frames (int): Number of frames to average over.
+
+    Returns:
+        dict: Average ms per frame for 'raw' and 'converted' surfaces.
+    """
+    pygame.init()
+    settings = Settings()
+    screen = pygame.display.set_mode((settings.screen_w, settings.screen_h))
+    screen_size = (settings.screen_w, settings.screen_h)
+    alien_size = (settings.alien_w, settings.alien_h)
+
+    raw_bg = pygame.transform.scale(pygame.image.load(settings.bg_file), screen_size)
+    raw_alien = pygame.transform.scale(pygame.image.load(settings.alien_file), alien_size)
+    surfaces = {
+        'raw': (raw_bg, raw_alien),
+        'converted': (raw_bg.convert(), raw_alien.convert_alpha())
+    }
+    positions = [(x, y) for x in range(0, settings.screen_w, settings.alien_w)
+                 for y in range(0, settings.screen_h // 2, settings.alien_h)]
+
+    results = {}
+    for name, (bg, alien) in surfaces.items():
+        start = time.perf_counter()
+        for _ in range(frames):
+            screen.blit(bg, (0, 0))
+            for pos in positions:
+                screen.blit(alien, pos)
+        results[name] = (time.perf_counter() - start) * 1000 / frames
+    return results
+
+
+def bench_sprite_loading(repeat=20):
+    """
+    Time loading every game sprite from separate files vs from packed atlas.
+
+    Args:
+        repeat (int): Number of cold loads to time.
+
+    Returns:
+        dict: 'files' and 'atlas' to timing result.
+    """
+    settings = Settings()
+    sprites = sprite_sizes(settings)
+    results = {}
+    if not settings.atlas_file.exists():
+        return results
+
+    def load(atlas):
+        assets = AssetCache(atlas=SpriteAtlas(settings.atlas_file) if atlas else None)
+        for path, size in sprites:
+            assets.load_image(path, size)
+
+    results['files'] = _timings(lambda: load(False), repeat)
+    results['atlas'] = _timings(lambda: load(True), repeat)
+    return results
+
+
+def bench_fleet_engines(alien_size=4, frames=60):
+    """
+    Time fleet update + draw per frame for sprite and vector engines.
+
+    Args:
+        alien_size (int): Alien width and height; smaller means more aliens.
+        frames (int): Number of frames to average over.
+
+    Returns:
+        dict: Engine name to (alien count, ms per frame).
+    """
+    from vector_fleet import VectorFleet
+
+    pygame.init()
+    settings = Settings()
+    settings.initialize_dynamic_settings()
+    settings.alien_w = settings.alien_h = alien_size
+    game = _make_game(settings)
+
+    results = {}
+    for name, engine in (('sprite', AlienFleet), ('vector', VectorFleet)):
+        fleet = engine(game)
+        fleet.create_fleet()
+        count = len(fleet.fleet) if name == 'sprite' else int(fleet.alive.sum())
+        start = time.perf_counter()
+        for _ in range(frames):
+            fleet.update_fleet()
+            fleet.check_fleet_bottom()
+            fleet.draw()
+        results[name] = (count, (time.perf_counter() - start) * 1000 / frames)
+    return results
+
+
+def bench_batch_blits(alien_sizes=(20, 10, 6), repeat=50):
+    """
+    Time full frame with per-sprite blits vs one batched blits call per layer.
+    Fleet layer is off so every alien is its own blit.
+
+    Args:
+        alien_sizes (tuple): Alien sizes to try; smaller means more aliens.
+        repeat (int): Frames to time per case.
+
+    Returns:
+        dict: (alien_size, batch) to (alien count, ms per frame).
+    """
+    results = {}
+    for alien_size in alien_sizes:
+        for batch in (False, True):
+            game = _headless_game((1200, 800), alien_size, fleet_layer=False, batch_blits=batch)
+            game._update_screen()
+            result = _timings(game._update_screen, repeat)
+            results[(alien_size, batch)] = (len(game.alien_fleet.fleet), result['mean_ms'])
+    return results
+
+
+def _fire_shots(arsenal, game, shots, pooled):
+    """
+    Fire shots and fly each bullet off screen. Unpooled mode
+    mirrors the old Arsenal: new Bullet per shot, copy of bullets in flight per frame.
+
+    Args:
+        arsenal (Arsenal): Arsenal to fire from.
+        game (SimpleNamespace): Game stand-in with ship.
+        shots (int): Number of shots.
+        pooled (bool): Use Arsenal pool, or build a new Bullet per shot.
+    """
+    for _ in range(shots):
+        if pooled:
+            arsenal.fire_bullet()
+        else:
+            bullet = Bullet(arsenal.image.get_size())
+            bullet.fire(game.ship.rect.midtop)
+            arsenal.arsenal[bullet] = None
+        for bullet in arsenal.arsenal:
+            bullet.y = -game.settings.bullet_h - 1
+        if pooled:
+            arsenal.update_arsenal()
+        else:
+            for bullet in arsenal.arsenal:
+                bullet.update(game.settings.bullet_speed)
+            for bullet in list(arsenal.arsenal):
+                if bullet.rect.bottom <= 0:
+                    arsenal.remove(bullet)
+
+
+def bench_bullet_pool(shots=10000):
+    """
+    Measure allocations for firing shots with and without bullet pool.
+
+    Args:
+        shots (int): Number of shots.
+
+    Returns:
+        dict: Mode to (peak KB traced, gc collections, ms).
+    """
+    pygame.init()
+    settings = Settings()
+    settings.initialize_dynamic_settings()
+    game = _make_game(settings)
+    game.ship = SimpleNamespace(rect=pygame.Rect(0, 700, 60, 60))
+
+    results = {}
+    for name, pooled in (('fresh', False), ('pooled', True)):
+        arsenal = Arsenal(game)
+        gc.collect()
+        collections = sum(stat['collections'] for stat in gc.get_stats())
+        tracemalloc.start()
+        start = time.perf_counter()
+        _fire_shots(arsenal, game, shots, pooled)
+        elapsed = (time.perf_counter() - start) * 1000
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+        collections = sum(stat['collections'] for stat in gc.get_stats()) - collections
+        results[name] = (peak, collections, elapsed)
+    return results
+
+
+def bench_entity_memory(counts=(1000, 10000, 100000)):
+    """
+    Measure traced bytes per Alien and Bullet at several entity counts.
+
+    Args:
+        counts (tuple): Numbers of entities to create.
+
+    Returns:
+        dict: (entity, count) to bytes per entity.
+    """
+    makers = {
+        'alien': lambda: Alien(0, 0, (60, 60)),
+        'bullet': lambda: Bullet((25, 80))
+    }
+    results = {}
+    for count in counts:
+        for name, make in makers.items():
+            gc.collect()
+            tracemalloc.start()
+            entities = [make() for _ in range(count)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            results[(name, count)] = size / count
+            del entities
+    return results
+
+
+def _commit():
+    """
+    Returns:
+        str: Current git commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(quick=False):
+    """
+    Run every benchmark.
+
+    Args:
+        quick (bool): Fewer repeats and sizes, for smoke runs.
+
+    Returns:
+        dict: Report with metadata and one entry per benchmark case.
+    """
+    repeat = 20 if quick else 200
+    screen_sizes = SCREEN_SIZES[1:2] if quick else SCREEN_SIZES
+    alien_sizes = ALIEN_SIZES[:2] if quick else ALIEN_SIZES
+    results = []
+
+    def add(name, params, result):
+        results.append({'name': name, 'params': params, **result})
+        if 'bytes_per_entity' in result:
+            value = f"{result['bytes_per_entity']:9.1f} B"
+        else:
+            value = f"{result.get('mean_ms', 0):9.3f} ms"
+        print(f"{name:<22} {json.dumps(params):<40} {value}")
+
+    for screen_size in screen_sizes:
+        for alien_size in alien_sizes:
+            params = {'screen': list(screen_size), 'alien_size': alien_size}
+            add('create_fleet', params, bench_create_fleet(screen_size, alien_size, repeat))
+            add('update_fleet', params, bench_update_fleet(screen_size, alien_size, repeat))
+            for render_mode in ('flip', 'dirty'):
+                add('render_frame', {**params, 'render_mode': render_mode},
+                    bench_render_frame(screen_size, alien_size, repeat, render_mode))
+    for bullets in BULLET_COUNTS:
+        for alien_size in alien_sizes:
+            add('check_collisions', {'bullets': bullets, 'alien_size': alien_size},
+                bench_check_collisions(bullets, alien_size, repeat))
+    add('fire_bullet', {}, bench_fire_bullet(repeat * 10))
+    add('hud_update_scores', {}, bench_hud_update_scores(repeat))
+
+    for name, ms in bench_blit_conversion(repeat).items():
+        add('blit_conversion', {'surfaces': name}, {'mean_ms': ms})
+    for name, result in bench_sprite_loading(repeat // 4 or 1).items():
+        add('sprite_loading', {'source': name}, result)
+    for name, (count, ms) in bench_fleet_engines(frames=repeat // 4 or 1).items():
+        add('fleet_engine', {'engine': name, 'aliens': count}, {'mean_ms': ms})
+    for (alien_size, batch), (count, ms) in bench_batch_blits(repeat=repeat // 4 or 1).items():
+        add('batch_blits', {'alien_size': alien_size, 'aliens': count, 'batch': batch}, {'mean_ms': ms})
+    for name, (peak, collections, ms) in bench_bullet_pool(repeat * 50).items():
+        add('bullet_pool', {'mode': name, 'shots': repeat * 50},
+            {'mean_ms': ms, 'peak_kb': peak, 'gc_collections': collections})
+
+    for (name, count), size in bench_entity_memory().items():
+        add('entity_memory', {'entity': name, 'count': count}, {'bytes_per_entity': size})
+
+    return {
+        'meta': {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+            'time': time.time(),
+            'quick': quick
+        },
+        'results': results
+    }
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmark Alien Invasion systems.')
+    parser.add_argument('--output', '-o', default='benchmark.json', help='JSON report file')
+    parser.add_argument('--quick', action='store_true', help='fewer repeats and sizes')
+    args = parser.parse_args()
+    report = run_suite(args.quick)
+    Path(args.output).write_text(json.dumps(report, indent = 4))
+    print(f'Wrote {len(report["results"])} results to {args.output}', file=sys.stderr)
@@ -5,41 +5,61 @@ Purpose: Manage ship ammunition.
 Date: 11/14/2025
 """
 
-import pygame
-from pygame.sprite import Sprite
-from typing import TYPE_CHECKING
+from pygame import Rect
+from renderer import round_coord
 
-if TYPE_CHECKING:
-    from alien_invasion import AlienInvasion
 
-class Bullet(Sprite):
+class Bullet:
     """
-    Base class for ship ammunition.
-    """    
-    def __init__(self, game: 'AlienInvasion'):
+    Base class for ship ammunition. Holds only position; image, settings
+    and whether it is in flight are tracked by Arsenal, which also draws it.
+    """
+    __slots__ = ('rect', 'y', 'prev_y')
+
+    def __init__(self, size: tuple):
         """
-        Initialize bullet: link game, settings, set position.
+        Initialize bullet. Bullet is positioned when fired.
+
+        Args:
+            size (tuple): (w, h) of bullet.
         """
-        super().__init__()
-        self.screen = game.screen
-        self.settings = game.settings
+        self.rect = Rect((0, 0), size)
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
 
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.bullet_w, self.settings.bullet_h))
+    def fire(self, midtop):
+        """
+        Place bullet at firing position.
 
-        self.rect = self.image.get_rect()
-        self.rect.midtop = game.ship.rect.midtop
+        Args:
+            midtop (tuple): Position to fire from.
+        """
+        self.rect.midtop = midtop
         self.y = float(self.rect.y)
+        self.prev_y = self.y
 
-    def update(self):
+    def update(self, speed: float):
         """
         Move bullet up screen.
+
+        Args:
+            speed (float): Distance to move this tick.
         """
-        self.y -= self.settings.bullet_speed
+        self.prev_y = self.y
+        self.y -= speed
         self.rect.y = self.y
 
-    def draw_bullet(self):
+    def draw_position(self, alpha=1.0):
         """
-        Draw bullet to screen.
+        Where to draw bullet this frame.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
+
+        Returns:
+            pygame.Rect or tuple: Draw position.
         """
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+        if alpha == 1.0:
+            return self.rect
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return (self.rect.x, round_coord(y))
@@ -42,8 +42,8 @@ class Button:
         """
         Draw button rect and message to screen.
         """
-        self.screen.fill(self.settings.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        self.game.renderer.fill(self.settings.button_color, self.rect)
+        self.game.renderer.blit(self.msg_image, self.msg_image_rect)
 
     def check_clicked(self, mouse_pos):
         """
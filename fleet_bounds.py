@@ -0,0 +1,106 @@
+"""
+Program Name: fleet_bounds.py
+Author: Jack Curcillo
+Purpose: Track extreme aliens of a rigidly moving fleet.
+Date: 11/14/2025
+"""
+
+
+class FleetBounds:
+    """
+    Track leftmost, rightmost, and bottom aliens of fleet.
+
+    Aliens are grouped by the column and row they were created in.
+    The fleet moves rigidly, so an alien in the outermost occupied
+    column or row always holds the fleet's current edge; movement and
+    drops need no bookkeeping, and removals only advance past empty
+    columns and rows.
+    """
+    def __init__(self):
+        """
+        Init empty bounds.
+        """
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all aliens.
+        """
+        self.columns = {}
+        self.rows = {}
+        self.col_keys = []
+        self.row_keys = []
+        self.slots = {}
+
+    def add(self, alien):
+        """
+        Add alien at its current (creation) position.
+
+        Args:
+            alien (Alien): Alien to track.
+        """
+        col, row = alien.rect.x, alien.rect.y
+        self.slots[alien] = (col, row)
+        self._add_to(self.columns, self.col_keys, col, alien)
+        self._add_to(self.rows, self.row_keys, row, alien)
+
+    def remove(self, alien):
+        """
+        Stop tracking alien, if tracked.
+
+        Args:
+            alien (Alien): Alien to remove.
+        """
+        slot = self.slots.pop(alien, None)
+        if slot is None:
+            return
+        col, row = slot
+        self._remove_from(self.columns, self.col_keys, col, alien)
+        self._remove_from(self.rows, self.row_keys, row, alien)
+
+    def _add_to(self, groups, keys, key, alien):
+        """
+        Add alien to a column or row group, keeping keys sorted.
+        """
+        if key not in groups:
+            groups[key] = {}
+            keys.append(key)
+            keys.sort()
+        groups[key][alien] = None
+
+    def _remove_from(self, groups, keys, key, alien):
+        """
+        Remove alien from a column or row group, dropping empty groups.
+        """
+        group = groups[key]
+        del group[alien]
+        if not group:
+            del groups[key]
+            keys.remove(key)
+
+    def leftmost(self):
+        """
+        Returns:
+            Alien: An alien in leftmost occupied column, or None.
+        """
+        return next(iter(self.columns[self.col_keys[0]])) if self.col_keys else None
+
+    def rightmost(self):
+        """
+        Returns:
+            Alien: An alien in rightmost occupied column, or None.
+        """
+        return next(iter(self.columns[self.col_keys[-1]])) if self.col_keys else None
+
+    def bottommost(self):
+        """
+        Returns:
+            Alien: An alien in lowest occupied row, or None.
+        """
+        return next(iter(self.rows[self.row_keys[-1]])) if self.row_keys else None
+
+    def __len__(self):
+        """
+        Number of tracked aliens.
+        """
+        return len(self.slots)
@@ -0,0 +1,183 @@
+"""
+Program Name: formations.py
+Author: Jack Curcillo
+Purpose: Compute and cache alien fleet layouts.
+Date: 11/14/2025
+"""
+
+
+def checkerboard(fleet_w, fleet_h):
+    """
+    Every other cell, alternating by row.
+
+    Args:
+        fleet_w (int): Number of columns.
+        fleet_h (int): Number of rows.
+
+    Returns:
+        list: (col, row) cells, row by row.
+    """
+    return [(col, row) for row in range(fleet_h) for col in range(fleet_w) if (row + col) % 2 == 1]
+
+
+def grid(fleet_w, fleet_h):
+    """
+    Every cell.
+    """
+    return [(col, row) for row in range(fleet_h) for col in range(fleet_w)]
+
+
+def stripes(fleet_w, fleet_h):
+    """
+    Full rows with an empty row between each.
+    """
+    return [(col, row) for row in range(0, fleet_h, 2) for col in range(fleet_w)]
+
+
+def diamond(fleet_w, fleet_h):
+    """
+    Cells inside a diamond touching middle of each side.
+    """
+    center_x = (fleet_w - 1) / 2
+    center_y = (fleet_h - 1) / 2
+    return [(col, row) for row in range(fleet_h) for col in range(fleet_w)
+            if abs(col - center_x) / max(center_x, 1) + abs(row - center_y) / max(center_y, 1) <= 1]
+
+
+def wedge(fleet_w, fleet_h):
+    """
+    Triangle pointing down: full top row narrowing to middle.
+    """
+    center_x = (fleet_w - 1) / 2
+    return [(col, row) for row in range(fleet_h) for col in range(fleet_w)
+            if abs(col - center_x) <= center_x * (1 - row / fleet_h)]
+
+
+PATTERNS = {
+    'checkerboard': checkerboard,
+    'grid': grid,
+    'stripes': stripes,
+    'diamond': diamond,
+    'wedge': wedge
+}
+
+
+def calculate_fleet_size(alien_w, screen_w, alien_h, screen_h):
+    """
+    Determine height and width of fleet
+
+    Args:
+        alien_w (int): Width of alien.
+        screen_w (int): Width of screen.
+        alien_h (int): Height of alien.
+        screen_h (int): Height of screen.
+
+    Returns:
+        tuple: (fleet_w, fleet_h) number of aliens horizontally and vertically
+    """
+    fleet_w = (screen_w//alien_w)
+    fleet_h = ((screen_h / 2) // alien_h)
+
+    if fleet_w % 2 == 0:
+        fleet_w -= 1
+    else:
+        fleet_w -= 2
+
+    if fleet_h % 2 == 0:
+        fleet_h -= 1
+    else:
+        fleet_h -= 2
+
+    return int(fleet_w), int(fleet_h)
+
+
+def calculate_offsets(alien_w, alien_h, screen_w, screen_h, fleet_w, fleet_h):
+    """
+    Calculate offsets that center fleet horizontally in screen and
+    vertically in top half.
+
+    Args:
+        alien_w (int): Width of alien.
+        alien_h (int): Height of alien.
+        screen_w (int): Width of screen.
+        screen_h (int): Height of screen.
+        fleet_w (int): Number of aliens horizontally.
+        fleet_h (int): Number of aliens vertically.
+
+    Returns:
+        tuple: (x_offset, y_offset)
+    """
+    half_screen = screen_h // 2
+    fleet_horizontal_space = fleet_w * alien_w
+    fleet_vertical_space = fleet_h * alien_h
+    x_offset = int((screen_w - fleet_horizontal_space) // 2)
+    y_offset = int((half_screen - fleet_vertical_space) // 2)
+    return x_offset, y_offset
+
+
+class FormationCache:
+    """
+    Alien positions of each layout, computed once per
+    (screen_w, screen_h, alien_w, alien_h, pattern).
+    """
+    def __init__(self):
+        """
+        Init empty formation cache and hit/miss counters.
+        """
+        self.formations = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, screen_w, screen_h, alien_w, alien_h, pattern='checkerboard'):
+        """
+        Get alien positions of a layout, computing it on first use.
+
+        Args:
+            screen_w (int): Width of screen.
+            screen_h (int): Height of screen.
+            alien_w (int): Width of alien.
+            alien_h (int): Height of alien.
+            pattern (str): Name of pattern in PATTERNS.
+
+        Returns:
+            tuple: (x, y) of each alien, row by row.
+
+        Raises:
+            ValueError: If pattern is unknown.
+        """
+        key = (screen_w, screen_h, alien_w, alien_h, pattern)
+        positions = self.formations.get(key)
+        if positions is not None:
+            self.hits += 1
+            return positions
+
+        if pattern not in PATTERNS:
+            raise ValueError(f'Unknown fleet pattern {pattern!r}, expected one of {", ".join(PATTERNS)}')
+        self.misses += 1
+        fleet_w, fleet_h = calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)
+        x_offset, y_offset = calculate_offsets(alien_w, alien_h, screen_w, screen_h, fleet_w, fleet_h)
+        positions = tuple((alien_w * col + x_offset, alien_h * row + y_offset)
+                          for col, row in PATTERNS[pattern](fleet_w, fleet_h))
+        self.formations[key] = positions
+        return positions
+
+    def clear(self):
+        """
+        Drop all cached formations and reset counters.
+        """
+        self.formations.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Report cache usage.
+
+        Returns:
+            dict: hits, misses, and number of cached formations.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'formations': len(self.formations)
+        }
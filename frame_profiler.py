@@ -0,0 +1,135 @@
+"""
+Program Name: frame_profiler.py
+Author: Jack Curcillo
+Purpose: Time each phase of the game loop.
+Date: 11/14/2025
+"""
+
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+
+class FrameProfiler:
+    """
+    Keep rolling frame-phase timings and report percentiles.
+    """
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window=600):
+        """
+        Init profiler: rolling window of samples per phase.
+
+        Args:
+            window (int): Number of recent frames kept per phase.
+        """
+        self.window = window
+        self.samples = {}
+        self.frames = 0
+        self.last = perf_counter()
+
+    def record(self, phase, start):
+        """
+        Record elapsed time of a phase.
+
+        Args:
+            phase (str): Phase name.
+            start (float): perf_counter() value when phase began.
+
+        Returns:
+            float: perf_counter() value at end of phase, to chain the next phase.
+        """
+        now = perf_counter()
+        if phase not in self.samples:
+            self.samples[phase] = deque(maxlen=self.window)
+        self.samples[phase].append((now - start) * 1000)
+        return now
+
+    def start_frame(self):
+        """
+        Start timing a frame; first mark is measured from here.
+
+        Returns:
+            float: perf_counter() value when frame began, for end_frame.
+        """
+        self.last = perf_counter()
+        return self.last
+
+    def mark(self, phase):
+        """
+        Record time since previous mark, or frame start, as a phase.
+
+        Args:
+            phase (str): Phase name.
+        """
+        self.last = self.record(phase, self.last)
+
+    def end_frame(self, start):
+        """
+        Record total frame time and count frame.
+
+        Args:
+            start (float): perf_counter() value when frame began.
+        """
+        self.record('frame', start)
+        self.frames += 1
+
+    def percentiles(self, phase):
+        """
+        Calculate p50/p95/p99 for a phase.
+
+        Args:
+            phase (str): Phase name.
+
+        Returns:
+            dict: Percentile label to milliseconds.
+        """
+        ordered = sorted(self.samples.get(phase, ()))
+        if not ordered:
+            return {f'p{p}': 0.0 for p in self.PERCENTILES}
+        last = len(ordered) - 1
+        return {f'p{p}': ordered[round(last * p / 100)] for p in self.PERCENTILES}
+
+    def summary(self):
+        """
+        Percentiles for every recorded phase.
+
+        Returns:
+            dict: Phase name to percentile dict.
+        """
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+    def report_lines(self):
+        """
+        Format summary as short text lines for on-screen overlay.
+
+        Returns:
+            list: One string per phase.
+        """
+        lines = []
+        for phase, values in self.summary().items():
+            stats = ' '.join(f'{label} {ms:.2f}' for label, ms in values.items())
+            lines.append(f'{phase}: {stats}')
+        return lines
+
+    def dump(self, path):
+        """
+        Write summary to CSV or JSON depending on file suffix.
+
+        Args:
+            path (Path): Output file (.csv or .json).
+        """
+        summary = self.summary()
+        try:
+            if path.suffix == '.csv':
+                with path.open('w', newline='') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(['phase'] + [f'p{p}' for p in self.PERCENTILES])
+                    for phase, values in summary.items():
+                        writer.writerow([phase] + [f'{ms:.4f}' for ms in values.values()])
+            else:
+                contents = {'frames': self.frames, 'phases': summary}
+                path.write_text(json.dumps(contents, indent = 4))
+        except FileNotFoundError as e:
+            print(f'File Not Found: {e}')
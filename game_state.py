@@ -0,0 +1,65 @@
+"""
+Program Name: game_state.py
+Author: Jack Curcillo
+Purpose: Track timed play/respawn/game-over states.
+Date: 11/14/2025
+"""
+
+
+class GameState:
+    """
+    Timed state machine: playing, respawning, game over.
+    """
+    PLAYING = 'playing'
+    RESPAWNING = 'respawning'
+    GAME_OVER = 'game_over'
+
+    def __init__(self):
+        """
+        Init state as game over (waiting for Play).
+        """
+        self.state = self.GAME_OVER
+        self.timer = 0.0
+
+    def start(self):
+        """
+        Begin playing immediately.
+        """
+        self.state = self.PLAYING
+        self.timer = 0.0
+
+    def respawn(self, delay):
+        """
+        Pause play for delay seconds of game time.
+
+        Args:
+            delay (float): Seconds until play resumes.
+        """
+        self.state = self.RESPAWNING
+        self.timer = delay
+
+    def game_over(self):
+        """
+        End play.
+        """
+        self.state = self.GAME_OVER
+        self.timer = 0.0
+
+    def update(self, dt):
+        """
+        Advance timer, switching to playing when respawn delay ends.
+
+        Args:
+            dt (float): Seconds of game time since last update.
+        """
+        if self.state == self.RESPAWNING:
+            self.timer -= dt
+            if self.timer <= 0:
+                self.start()
+
+    def is_playing(self):
+        """
+        Returns:
+            bool: True if gameplay should update, else False.
+        """
+        return self.state == self.PLAYING
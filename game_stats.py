@@ -6,6 +6,8 @@ Date: 11/14/2025
 """
 
 import json
+from score_writer import ScoreWriter
+from leaderboard import Leaderboard
 
 from typing import TYPE_CHECKING
 
@@ -24,44 +26,87 @@ class GameStats():
         self.game = game
         self.settings = game.settings
         self.max_score = 0
+        self.leaderboard = None
+        if self.settings.persist_scores and self.settings.leaderboard_file:
+            self.leaderboard = Leaderboard(self.settings.leaderboard_file)
         self.init_saved_scores()
         self.reset_stats()
 
     def init_saved_scores(self):
         """
-        Load hi-score from JSON file or initialize to 0.
+        Load hi-score from leaderboard index and JSON file, or initialize to 0.
+        Missing, empty, or corrupted files start from 0.
         """
         self.path = self.settings.scores_file
-        if self.path.exists() and self.path.stat.__sizeof__() > 20:
-            contents = self.path.read_text()
-            scores = json.loads(contents)
-            self.hi_score = scores.get('hi_score', 0)
-        else:
-            self.hi_score = 0
+        self.writer = ScoreWriter(self.path, self.settings.score_save_delay)
+        saved = self._load_hi_score()
+        self.hi_score = saved or 0
+        if self.leaderboard:
+            self.hi_score = max(self.hi_score, self.leaderboard.top_score())
+        if saved is None:
             self.save_scores()
             # save the file
 
+    def _load_hi_score(self):
+        """
+        Read hi-score from JSON file.
+
+        Returns:
+            int: Saved hi-score, or None if file is missing or unreadable.
+        """
+        try:
+            if self.path.stat().st_size == 0:
+                return None
+            scores = json.loads(self.path.read_text())
+            return int(scores.get('hi_score', 0))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f'Ignoring unreadable scores file: {e}')
+            return None
+
 
     def save_scores(self):
         """
-        Save hi-score to JSON file.
+        Queue hi-score to be saved to JSON file in background.
         """
+        if not self.settings.persist_scores:
+            return
         scores = {
             'hi_score': self.hi_score
-        }            
+        }
         contents = json.dumps(scores, indent = 4)
-        try:
-            self.path.write_text(contents)
-        except FileNotFoundError as e:
-            print(f'File Not Found: {e}')
+        self.writer.save(contents)
+
+    def flush_scores(self):
+        """
+        Finish any pending save before quitting.
+        """
+        self.writer.flush()
+
+    def record_run(self):
+        """
+        Add finished run to leaderboard.
+        """
+        if self.leaderboard:
+            self.leaderboard.record_run(self.settings.player_name, self.score, self.level, self.play_time)
+
+    def close(self):
+        """
+        Flush scores and close leaderboard.
+        """
+        self.flush_scores()
+        if self.leaderboard:
+            self.leaderboard.close()
 
     def reset_stats(self):
         """
-        Reset lives, score, level.
+        Reset lives, score, level, play time.
         """
         self.ships_left = self.settings.starting_ship_count
         self.score = 0
         self.level = 1
+        self.play_time = 0.0
 
     def update(self, collisions):
         """
@@ -86,6 +131,7 @@ class GameStats():
         """ 
         if self.score > self.hi_score:
             self.hi_score = self.score
+            self.save_scores()
         # print(f'Hi: {self.hi_score}')
 
     def _update_score(self, collisions):
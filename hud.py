@@ -6,6 +6,7 @@ Date: 11/14/2025
 """
 
 import pygame.font
+from text_cache import TextCache, GlyphAtlas
 # from typing import TYPE_CHECKING
 
 # if TYPE_CHECKING:
@@ -23,10 +24,18 @@ class HUD:
         self.game = game
         self.settings = game.settings
         self.screen = game.screen
+        self.renderer = game.renderer
         self.boundaries = game.screen.get_rect()
         self.game_stats = game.game_stats
         self.font = pygame.font.Font(self.settings.font_file, self.settings.HUD_font_size)
         self.padding = 20
+        self.profile_font = pygame.font.Font(self.settings.font_file, self.settings.profile_font_size)
+        self.profile_images = []
+        self.text_cache = TextCache(self.settings.HUD_text_cache_size)
+        self.glyphs = None
+        if self.settings.HUD_glyph_atlas:
+            self.glyphs = GlyphAtlas(self.font, self.settings.text_color)
+        self.shown = {}
         self.update_scores()
         self._setup_life_image()
         self.update_level()
@@ -39,50 +48,87 @@ class HUD:
         self._update_score()
         self._update_hi_score()
 
+    def _changed(self, field, value):
+        """
+        Check if value differs from what is currently shown, and remember it.
+
+        Args:
+            field (str): HUD field name.
+            value (int): Current value from game stats.
+
+        Returns:
+            bool: True if field needs re-rendering, else False.
+        """
+        if self.shown.get(field) == value:
+            return False
+        self.shown[field] = value
+        return True
+
+    def _render(self, text):
+        """
+        Render HUD text through glyph atlas or text cache.
+
+        Args:
+            text (str): Text to render.
+
+        Returns:
+            pygame.Surface: Rendered text.
+        """
+        if self.glyphs:
+            return self.glyphs.render(text)
+        return self.text_cache.render(self.font, self.settings.HUD_font_size, text, self.settings.text_color)
+
     def _setup_life_image(self):
         """
         Load and scale life image.
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(self.life_image, (self.settings.ship_w, self.settings.ship_h))
+        self.life_image = self.game.assets.load_image(self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h))
         self.life_rect = self.life_image.get_rect()
 
 
     def _update_score(self):
         """
-        Render current score image.
+        Render current score image, if score changed.
         """
+        if not self._changed('score', self.game_stats.score):
+            return
         score_str = f'Score: {self.game_stats.score: ,.0f}'
-        self.score_image = self.font.render(score_str, True, self.settings.text_color, None)
+        self.score_image = self._render(score_str)
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.boundaries.right - self.padding
         self.score_rect.top = self.max_score_rect.bottom + self.padding
 
     def _update_max_score(self):
         """
-        Render max score image.
+        Render max score image, if max score changed.
         """
+        if not self._changed('max_score', self.game_stats.max_score):
+            return
         max_score_str = f' Max-Score: {self.game_stats.max_score: ,.0f}'
-        self.max_score_image = self.font.render(max_score_str, True, self.settings.text_color, None)
+        self.max_score_image = self._render(max_score_str)
         self.max_score_rect = self.max_score_image.get_rect()
         self.max_score_rect.right = self.boundaries.right - self.padding
         self.max_score_rect.top = self.padding
 
     def _update_hi_score(self):
         """
-        Render hi score image.
+        Render hi score image, if hi score changed.
         """
+        if not self._changed('hi_score', self.game_stats.hi_score):
+            return
         hi_score_str = f'Hi-Score: {self.game_stats.hi_score: ,.0f}'
-        self.hi_score_image = self.font.render(hi_score_str, True, self.settings.text_color, None)
+        self.hi_score_image = self._render(hi_score_str)
         self.hi_score_rect = self.hi_score_image.get_rect()
         self.hi_score_rect.midtop = (self.boundaries.centerx, self.padding)
 
     def update_level(self):
         """
-        Render level image.
+        Render level image, if level changed.
         """
+        if not self._changed('level', self.game_stats.level):
+            return
         level_str = f'Level: {self.game_stats.level: ,.0f}'
-        self.level_image = self.font.render(level_str, True, self.settings.text_color, None)
+        self.level_image = self._render(level_str)
         self.level_rect = self.level_image.get_rect()
         self.level_rect.left = self.padding
         self.level_rect.top = self.life_rect.bottom + self.padding
@@ -91,19 +137,35 @@ class HUD:
         """
         Draw remaining lives.
         """
-        current_x = self.padding
-        current_y = self.padding
-        for _ in range(self.game_stats.ships_left):
-            self.screen.blit(self.life_image, (current_x, current_y))
-            current_x += self.life_rect.width + self.padding
+        step = self.life_rect.width + self.padding
+        self.renderer.blits([(self.life_image, (self.padding + step * life, self.padding))
+                             for life in range(self.game_stats.ships_left)])
 
     def draw(self):
         """
         Draw HUD to screen.
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
+        self.renderer.blits([
+            (self.hi_score_image, self.hi_score_rect),
+            (self.max_score_image, self.max_score_rect),
+            (self.score_image, self.score_rect),
+            (self.level_image, self.level_rect)
+        ])
         self._draw_lives()
 
+    def draw_profile(self, profiler):
+        """
+        Draw frame profiler percentiles in bottom-left corner.
+
+        Args:
+            profiler (FrameProfiler): Profiler to report from.
+        """
+        if profiler.frames % 30 == 0 or not self.profile_images:
+            self.profile_images = [
+                self.profile_font.render(line, True, self.settings.text_color, None)
+                for line in profiler.report_lines()
+            ]
+        current_y = self.boundaries.bottom - self.padding
+        for image in reversed(self.profile_images):
+            current_y -= image.get_height()
+            self.renderer.blit(image, (self.padding, current_y))
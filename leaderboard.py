@@ -0,0 +1,165 @@
+"""
+Program Name: leaderboard.py
+Author: Jack Curcillo
+Purpose: Store finished runs and answer leaderboard queries.
+Date: 11/14/2025
+"""
+
+import sqlite3
+import time
+
+
+class Leaderboard:
+    """
+    SQLite store of finished runs, indexed for top-N and per-player queries.
+
+    A per-score run count table is kept alongside the runs, so
+    percentile queries sum over distinct scores instead of runs.
+    """
+    def __init__(self, path):
+        """
+        Open (or create) leaderboard database.
+
+        Args:
+            path (Path): Database file, or ':memory:'.
+        """
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                player TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                level INTEGER NOT NULL,
+                duration REAL NOT NULL,
+                timestamp REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS runs_score ON runs (score);
+            CREATE INDEX IF NOT EXISTS runs_player_score ON runs (player, score);
+            CREATE TABLE IF NOT EXISTS score_counts (
+                score INTEGER PRIMARY KEY,
+                runs INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS totals (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                runs INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO totals (id, runs) VALUES (0, 0);
+        ''')
+        self.connection.commit()
+
+    def record_run(self, player, score, level, duration, timestamp=None):
+        """
+        Append a finished run.
+
+        Args:
+            player (str): Player name.
+            score (int): Final score.
+            level (int): Level reached.
+            duration (float): Seconds of play.
+            timestamp (float): Unix time run ended, or None for now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.record_runs([(player, score, level, duration, timestamp)])
+
+    def record_runs(self, runs):
+        """
+        Append many finished runs in one transaction.
+
+        Args:
+            runs (list): (player, score, level, duration, timestamp) tuples.
+        """
+        runs = list(runs)
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO runs (player, score, level, duration, timestamp) VALUES (?, ?, ?, ?, ?)',
+                runs)
+            self.connection.executemany(
+                'INSERT INTO score_counts (score, runs) VALUES (?, 1) '
+                'ON CONFLICT (score) DO UPDATE SET runs = runs + 1',
+                [(run[1],) for run in runs])
+            self.connection.execute('UPDATE totals SET runs = runs + ? WHERE id = 0', (len(runs),))
+
+    def top_score(self):
+        """
+        Returns:
+            int: Best score ever recorded, or 0 if no runs.
+        """
+        row = self.connection.execute('SELECT MAX(score) FROM score_counts').fetchone()
+        return row[0] or 0
+
+    def top(self, count=10):
+        """
+        Best runs, highest score first.
+
+        Args:
+            count (int): Number of runs.
+
+        Returns:
+            list: Dicts with player, score, level, duration, timestamp.
+        """
+        rows = self.connection.execute(
+            'SELECT player, score, level, duration, timestamp FROM runs '
+            'ORDER BY score DESC LIMIT ?', (count,))
+        return [self._as_dict(row) for row in rows]
+
+    def player_best(self, player):
+        """
+        Best run of one player.
+
+        Args:
+            player (str): Player name.
+
+        Returns:
+            dict: Best run, or None if player has no runs.
+        """
+        row = self.connection.execute(
+            'SELECT player, score, level, duration, timestamp FROM runs '
+            'WHERE player = ? ORDER BY score DESC LIMIT 1', (player,)).fetchone()
+        return self._as_dict(row) if row else None
+
+    def percentile(self, score):
+        """
+        Percent of recorded runs that scored below score.
+
+        Args:
+            score (int): Score to rank.
+
+        Returns:
+            float: 0-100, or 0 if no runs.
+        """
+        total = self.run_count()
+        if not total:
+            return 0.0
+        below = self.connection.execute(
+            'SELECT SUM(runs) FROM score_counts WHERE score < ?', (score,)).fetchone()[0]
+        return (below or 0) * 100 / total
+
+    def run_count(self):
+        """
+        Returns:
+            int: Number of recorded runs.
+        """
+        return self.connection.execute('SELECT runs FROM totals WHERE id = 0').fetchone()[0]
+
+    def close(self):
+        """
+        Close database.
+        """
+        self.connection.close()
+
+    @staticmethod
+    def _as_dict(row):
+        """
+        Convert result row to dict.
+        """
+        player, score, level, duration, timestamp = row
+        return {
+            'player': player,
+            'score': score,
+            'level': level,
+            'duration': duration,
+            'timestamp': timestamp
+        }
@@ -0,0 +1,132 @@
+"""
+Program Name: renderer.py
+Author: Jack Curcillo
+Purpose: Draw frames with full flips or dirty rectangles.
+Date: 11/14/2025
+"""
+
+import math
+import pygame
+
+
+def round_coord(value):
+    """
+    Round a coordinate like pygame.Rect does: halves away from zero.
+
+    Args:
+        value (float): Coordinate.
+
+    Returns:
+        int: Rounded coordinate.
+    """
+    return math.floor(value + 0.5) if value >= 0 else -math.floor(0.5 - value)
+
+
+class Renderer:
+    """
+    Route all drawing to screen and present each frame.
+
+    In 'flip' mode every frame redraws the background and flips the
+    whole display. In 'dirty' mode only areas drawn last frame are
+    restored from background, and only those plus areas drawn this
+    frame are pushed with display.update(rects).
+
+    With batching on, blits are queued and sent to screen with one
+    Surface.blits call per layer; a fill or end of frame closes a layer.
+    """
+    def __init__(self, screen, background, mode='flip', batch=False):
+        """
+        Init renderer: screen, background, mode, dirty rect lists, batch queue.
+
+        Args:
+            screen (pygame.Surface): Display surface.
+            background (pygame.Surface): Full-screen background.
+            mode (str): 'flip' or 'dirty'.
+            batch (bool): Queue blits and submit them together.
+        """
+        self.screen = screen
+        self.background = background
+        self.mode = mode
+        self.batch = [] if batch else None
+        self.dirty = []
+        self.previous = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """
+        Force next frame to redraw and present whole screen.
+        """
+        self.full_redraw = True
+
+    def begin_frame(self):
+        """
+        Draw background, either whole or only where sprites were last frame.
+        """
+        if self.mode == 'dirty' and not self.full_redraw:
+            background = self.background
+            blit = self.screen.blit
+            for rect in self.previous:
+                blit(background, rect, rect)
+        else:
+            self.screen.blit(self.background, (0, 0))
+
+    def blit(self, surface, dest, area=None):
+        """
+        Draw (or queue) surface to screen and record changed area.
+
+        Args:
+            surface (pygame.Surface): Image to draw.
+            dest (pygame.Rect or tuple): Where to draw.
+            area (pygame.Rect): Part of surface to draw, or None for all.
+        """
+        if self.batch is not None:
+            self.batch.append((surface, dest, area) if area else (surface, dest))
+        else:
+            self.dirty.append(self.screen.blit(surface, dest, area))
+
+    def blits(self, blit_sequence):
+        """
+        Draw (or queue) many (surface, dest) pairs and record changed areas.
+        Unbatched, each pair is its own screen.blit call.
+
+        Args:
+            blit_sequence (list): (surface, dest) pairs.
+        """
+        if self.batch is not None:
+            self.batch.extend(blit_sequence)
+        else:
+            blit = self.screen.blit
+            self.dirty.extend([blit(surface, dest) for surface, dest in blit_sequence])
+
+    def flush(self):
+        """
+        Submit queued blits as one layer.
+        """
+        if self.batch:
+            self.dirty.extend(self.screen.blits(self.batch))
+            self.batch.clear()
+
+    def fill(self, color, rect):
+        """
+        Fill area of screen with color and record changed area.
+        Queued blits are drawn first so layers stay in order.
+
+        Args:
+            color (tuple): RGB color.
+            rect (pygame.Rect): Area to fill.
+        """
+        self.flush()
+        self.dirty.append(self.screen.fill(color, rect))
+
+    def end_frame(self):
+        """
+        Present frame: flip whole display, or update changed areas only.
+        """
+        self.flush()
+        if self.mode == 'dirty' and not self.full_redraw:
+            pygame.display.update(self.previous + self.dirty)
+        else:
+            pygame.display.flip()
+            self.full_redraw = False
+        self.previous = self.dirty
+        self.dirty = []
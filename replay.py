@@ -0,0 +1,208 @@
+"""
+Program Name: replay.py
+Author: Jack Curcillo
+Purpose: Record per-tick input and replay runs headless.
+Date: 11/14/2025
+"""
+
+import json
+import struct
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+MAGIC = b'AIRP'
+VERSION = 2
+HEADER = struct.Struct('<4sHQI')
+SETTINGS = struct.Struct('<I')
+RUN = struct.Struct('<BH')
+FOOTER = struct.Struct('<QI')
+
+LEFT = 1
+RIGHT = 2
+FIRE = 4
+ACTIONS = (('left', LEFT), ('right', RIGHT), ('fire', FIRE))
+
+
+def encode_inputs(inputs):
+    """
+    Pack action names into one byte.
+
+    Args:
+        inputs (iterable): Action names: 'left', 'right', 'fire'.
+
+    Returns:
+        int: Bitmask of actions.
+    """
+    return sum(bit for name, bit in ACTIONS if name in inputs)
+
+
+def decode_inputs(mask):
+    """
+    Unpack byte into action names.
+
+    Args:
+        mask (int): Bitmask of actions.
+
+    Returns:
+        frozenset: Action names.
+    """
+    return frozenset(name for name, bit in ACTIONS if mask & bit)
+
+
+class InputRecorder:
+    """
+    Collect per-tick inputs of one run and save them as a replay file.
+    """
+    def __init__(self, path):
+        """
+        Init recorder.
+
+        Args:
+            path (Path): Replay file to write.
+        """
+        self.path = Path(path)
+        self.seed = 0
+        self.settings = {}
+        self.ticks = []
+        self.recording = False
+
+    def start(self, seed, settings=None):
+        """
+        Begin recording a new run.
+
+        Args:
+            seed (int): RNG seed of run.
+            settings (dict): Preset settings run is played with, in JSON form.
+        """
+        self.seed = seed
+        self.settings = settings or {}
+        self.ticks = []
+        self.recording = True
+
+    def record(self, inputs):
+        """
+        Record inputs held during one tick.
+
+        Args:
+            inputs (iterable): Action names.
+        """
+        if self.recording:
+            self.ticks.append(encode_inputs(inputs))
+
+    def save(self, score, level):
+        """
+        Write recording with final score and level, and stop recording.
+
+        Args:
+            score (int): Final score.
+            level (int): Final level.
+        """
+        if not self.recording:
+            return
+        self.recording = False
+        runs = []
+        for mask in self.ticks:
+            if runs and runs[-1][0] == mask and runs[-1][1] < 0xFFFF:
+                runs[-1][1] += 1
+            else:
+                runs.append([mask, 1])
+
+        settings = json.dumps(self.settings).encode()
+        data = [HEADER.pack(MAGIC, VERSION, self.seed, len(runs)), SETTINGS.pack(len(settings)), settings]
+        data.extend(RUN.pack(mask, count) for mask, count in runs)
+        data.append(FOOTER.pack(score, level))
+        try:
+            self.path.write_bytes(b''.join(data))
+        except FileNotFoundError as e:
+            print(f'File Not Found: {e}')
+
+
+class Replay:
+    """
+    Loaded replay: seed, preset settings, per-tick inputs, expected final stats.
+    """
+    def __init__(self, path):
+        """
+        Load replay file.
+
+        Args:
+            path (Path): Replay file to read.
+
+        Raises:
+            ValueError: If file is not a replay of a supported version, or is
+                truncated or corrupt.
+        """
+        data = Path(path).read_bytes()
+        try:
+            magic, version, self.seed, run_count = HEADER.unpack_from(data)
+            if magic != MAGIC or version not in (1, VERSION):
+                raise ValueError(f'{path} is not a version 1-{VERSION} replay file')
+
+            offset = HEADER.size
+            self.settings = {}
+            # version 1 files were recorded with default settings
+            if version >= 2:
+                size, = SETTINGS.unpack_from(data, offset)
+                offset += SETTINGS.size
+                self.settings = json.loads(data[offset:offset + size])
+                offset += size
+
+            self.ticks = []
+            for _ in range(run_count):
+                mask, count = RUN.unpack_from(data, offset)
+                self.ticks.extend([decode_inputs(mask)] * count)
+                offset += RUN.size
+            self.score, self.level = FOOTER.unpack_from(data, offset)
+        except (struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f'{path} is truncated or corrupt: {e}') from e
+        if not isinstance(self.settings, dict):
+            raise ValueError(f'{path} is truncated or corrupt: settings are not a JSON object')
+
+
+def play_replay(path, game=None, preset=None):
+    """
+    Drive a headless game from a replay file at uncapped speed.
+
+    Args:
+        path (Path): Replay file.
+        game (AlienInvasion): Game to drive, or None for a new headless
+            game that does not save scores.
+        preset (str): Settings preset to replay with instead of the
+            settings recorded in file, or None.
+
+    Returns:
+        tuple: (matched, score, level, replay) where matched is True when
+            final score and level equal the recorded ones.
+    """
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+
+    replay = Replay(path)
+    if game is None:
+        settings = Settings(preset)
+        if preset is None:
+            settings.apply(replay.settings, path)
+        game = AlienInvasion(headless=True, settings=settings)
+    game.restart_game(seed=replay.seed)
+    for inputs in replay.ticks:
+        if not game.step(inputs):
+            break
+    score = game.game_stats.score
+    level = game.game_stats.level
+    return (score, level) == (replay.score, replay.level), score, level, replay
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Replay a recorded run headless and check its final score.')
+    parser.add_argument('file', help='replay file written with alien_invasion.py --record')
+    parser.add_argument('--preset', metavar='NAME',
+                        help='settings preset to replay with (default: settings recorded in file)')
+    args = parser.parse_args()
+    try:
+        matched, score, level, replay = play_replay(args.file, preset=args.preset)
+    except (OSError, ValueError) as e:
+        sys.exit(f'Cannot replay {args.file}: {e}')
+    print(f'Replayed {len(replay.ticks)} ticks: score {score} (recorded {replay.score}), '
+          f'level {level} (recorded {replay.level})')
+    sys.exit(0 if matched else 1)
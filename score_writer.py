@@ -0,0 +1,110 @@
+"""
+Program Name: score_writer.py
+Author: Jack Curcillo
+Purpose: Write score files atomically on a background thread.
+Date: 11/14/2025
+"""
+
+import os
+import threading
+from time import monotonic
+
+
+class ScoreWriter:
+    """
+    Debounced background writer with temp-file + rename saves.
+    """
+    def __init__(self, path, delay=1.0):
+        """
+        Init writer: target file, debounce delay. Thread starts on first save.
+
+        Args:
+            path (Path): File to write.
+            delay (float): Seconds to wait for further saves before writing.
+        """
+        self.path = path
+        self.delay = delay
+        self.pending = None
+        self.deadline = 0.0
+        self.condition = threading.Condition()
+        self.thread = None
+        self.stopping = False
+
+    def save(self, contents):
+        """
+        Queue contents to be written after delay; later saves replace earlier
+        ones and push write back.
+
+        Args:
+            contents (str): Full file contents.
+        """
+        with self.condition:
+            self.pending = contents
+            self.deadline = monotonic() + self.delay
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name='ScoreWriter', daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def flush(self):
+        """
+        Write any pending contents now and stop background thread.
+        """
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self._write_pending()
+        self.stopping = False
+
+    def _run(self):
+        """
+        Thread loop: wait for a save, then until delay passes with no new save, then write.
+        """
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopping:
+                    self.condition.wait()
+                while not self.stopping:
+                    remaining = self.deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                if self.stopping:
+                    return
+            self._write_pending()
+
+    def _write_pending(self):
+        """
+        Take pending contents, if any, and write them.
+        """
+        with self.condition:
+            contents = self.pending
+            self.pending = None
+        if contents is not None:
+            self.write_atomic(self.path, contents)
+
+    @staticmethod
+    def write_atomic(path, contents):
+        """
+        Write file via temp file and rename so readers never see a partial file.
+
+        Args:
+            path (Path): File to write.
+            contents (str): Full file contents.
+        """
+        temp_path = path.with_name(path.name + '.tmp')
+        try:
+            with temp_path.open('w') as file:
+                file.write(contents)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f'Could not save {path.name}: {e}')
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
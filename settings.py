@@ -5,42 +5,118 @@ Purpose: Store game and object settings.
 Date: 11/14/2025
 """
 
+import json
 from pathlib import Path
+from formations import PATTERNS
+
+BASE_DIR = Path(__file__).resolve().parent
+ASSETS_DIR = BASE_DIR / 'Assets'
+PRESETS_DIR = BASE_DIR / 'presets'
+#speeds are pixels per tick at this simulation rate, scaled to sim_rate
+BASE_RATE = 60
+
+#settings reset by initialize_dynamic_settings at each restart
+DYNAMIC_SETTINGS = ('ship_speed', 'starting_ship_count', 'bullet_speed', 'bullet_w', 'bullet_h',
+                    'bullet_amount', 'fleet_speed', 'fleet_direction', 'fleet_drop_speed', 'alien_points')
+#settings only read while game starts up
+RESTART_SETTINGS = ('name', 'screen_w', 'screen_h', 'bg_file', 'scores_file', 'persist_scores',
+                    'leaderboard_file', 'rle_sprites', 'sprite_atlas', 'atlas_file', 'sound',
+                    'sound_volume', 'profile', 'profile_window', 'ship_file', 'ship_w', 'ship_h',
+                    'bullet_file', 'bullet_w', 'bullet_h', 'laser_sound', 'impact_sound',
+                    'alien_file', 'alien_w', 'alien_h', 'fleet_engine', 'button_w', 'button_h',
+                    'button_color', 'text_color', 'button_font_size', 'HUD_font_size',
+                    'profile_font_size', 'HUD_text_cache_size', 'HUD_glyph_atlas', 'font_file')
+CHOICES = {
+    'render_mode': ('flip', 'dirty'),
+    'fleet_engine': ('sprite', 'vector'),
+    'fleet_pattern': tuple(PATTERNS),
+    'fleet_direction': (1, -1)
+}
+#numbers that may be zero; every other number must be positive
+NON_NEGATIVE = ('respawn_delay', 'score_save_delay', 'sound_interval', 'starting_ship_count', 'fleet_drop_speed', 'alien_points')
+
+
+def resolve_preset(preset):
+    """
+    Find settings preset file from a name or path.
+
+    Args:
+        preset (str or Path): Preset name in presets/, or path to a .json file.
+
+    Returns:
+        Path: Preset file.
+    """
+    path = Path(preset)
+    if path.suffix != '.json':
+        return PRESETS_DIR / f'{preset}.json'
+    if not path.is_absolute() and not path.exists():
+        return BASE_DIR / path
+    return path
+
 
 class Settings:
     """
     Store all game settings: screen, ship, bullet, alien, font, button.
     """
-    def __init__(self):
+    def __init__(self, preset=None):
         """
-        Init base settings: screen size, assets, colors.
+        Init base settings: screen size, assets, colors. Then apply preset, if given.
+
+        Args:
+            preset (str or Path): Settings preset name or file, or None for defaults.
         """
         #base settings, background
         self.name: str = 'Alien Invasion'
         self.screen_w = 1200
         self.screen_h = 800
         self.FPS = 60
-        self.bg_file = Path.cwd() / 'Assets' / 'images' / 'replacement_bg.webp'
+        self.sim_rate = 60
+        self.max_catchup_ticks = 5
+        self.bg_file = ASSETS_DIR / 'images' / 'replacement_bg.webp'
         self.difficulty_scale = 1.1
-        self.scores_file = Path.cwd() / 'Assets' / 'file' / 'scores.json'
+        self.respawn_delay = 0.5
+        self.scores_file = ASSETS_DIR / 'file' / 'scores.json'
+        self.score_save_delay = 1.0
+        self.persist_scores = True
+        self.leaderboard_file = ASSETS_DIR / 'file' / 'leaderboard.db'
+        self.player_name = 'Player'
+        self.rle_sprites = False
+        self.render_mode = 'flip'
+        self.batch_blits = True
+        self.sprite_atlas = True
+        self.atlas_file = ASSETS_DIR / 'images' / 'sprites.json'
+        self.sound = True
+        self.sound_volume = 0.05
+        self.sound_interval = 0.05
+        self.hot_reload = True
+        self.reload_interval = 1.0
+
+        #profiler settings
+        self.profile = False
+        self.profile_overlay = False
+        self.profile_window = 600
+        self.profile_file = BASE_DIR / 'profile.json'
 
         #ship settings
-        self.ship_file = Path.cwd() / 'Assets' / 'images' / 'replacement_ship.png'
+        self.ship_file = ASSETS_DIR / 'images' / 'replacement_ship.png'
         self.ship_w = 60
         self.ship_h = 60
         
 
         #bullet settings
-        self.bullet_file = Path.cwd() / 'Assets' / 'images' / 'replacement_laser.png'
-        self.laser_sound = Path.cwd() / 'Assets' / 'sound' / 'replacement_laser.mp3'
-        self.impact_sound = Path.cwd() / 'Assets' / 'sound' / 'replacement_impact.mp3'
+        self.bullet_file = ASSETS_DIR / 'images' / 'replacement_laser.png'
+        self.laser_sound = ASSETS_DIR / 'sound' / 'replacement_laser.mp3'
+        self.impact_sound = ASSETS_DIR / 'sound' / 'replacement_impact.mp3'
         
 
         #alien settings
-        self.alien_file = Path.cwd() / 'Assets' / 'images' / 'replacement_enemy.png'
+        self.alien_file = ASSETS_DIR / 'images' / 'replacement_enemy.png'
         self.alien_w = 60
         self.alien_h = 60
-        self.fleet_speed = 2
+        self.fleet_engine = 'sprite'
+        self.fleet_bounds_debug = False
+        self.fleet_layer = True
+        self.fleet_pattern = 'checkerboard'
         
         
 
@@ -53,13 +129,157 @@ class Settings:
         self.text_color = (255, 255, 255)
         self.button_font_size = 48
         self.HUD_font_size = 20
-        self.font_file = Path.cwd() / 'Assets' / 'Fonts' / 'replacement_font.ttf'
+        self.profile_font_size = 10
+        self.HUD_text_cache_size = 32
+        self.HUD_glyph_atlas = False
+        self.font_file = ASSETS_DIR / 'Fonts' / 'replacement_font.ttf'
+
+        #preset settings
+        self.preset_source = None
+        self.overrides = {}
+        self.initialize_dynamic_settings()
+        if preset:
+            self.load(preset)
+
+    def load(self, preset):
+        """
+        Apply settings from JSON preset over defaults and reset dynamic settings.
+
+        Args:
+            preset (str or Path): Settings preset name or file.
+
+        Raises:
+            FileNotFoundError: If preset does not exist.
+            ValueError: If preset is not valid JSON or has invalid settings.
+        """
+        path = resolve_preset(preset)
+        try:
+            values = json.loads(path.read_text())
+        except json.JSONDecodeError as e:
+            raise ValueError(f'{path}: {e}') from e
+        if not isinstance(values, dict):
+            raise ValueError(f'{path}: preset must be a JSON object')
+        self.overrides = {}
+        self.apply(values, path)
+        self.preset_source = path
+
+    def apply(self, values, source):
+        """
+        Validate and apply settings over current ones, then reset dynamic settings.
+
+        Args:
+            values (dict): Setting name to JSON-style value.
+            source (str or Path): Where values came from, for error messages.
+
+        Raises:
+            ValueError: If any setting is invalid; nothing is applied.
+        """
+        values = self._validate(values, source)
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.overrides = {**self.overrides, **values}
+        self.initialize_dynamic_settings()
+
+    def reload(self):
+        """
+        Re-read current preset. Settings removed from preset go back to defaults.
+        Current settings are kept if preset is invalid. Changed RESTART_SETTINGS
+        are reported but not applied; they take effect on next start.
+
+        Returns:
+            list: Names of settings that changed.
+
+        Raises:
+            FileNotFoundError: If preset no longer exists.
+            ValueError: If preset is not valid.
+        """
+        fresh = Settings(self.preset_source)
+        # compare preset values, not live ones, so difficulty scaling is kept
+        changed = [name for name in fresh.overrides.keys() | self.overrides.keys()
+                   if fresh.overrides.get(name, fresh) != self.overrides.get(name, fresh)]
+        overrides = dict(fresh.overrides)
+        for name in changed:
+            if name not in RESTART_SETTINGS:
+                setattr(self, name, getattr(fresh, name))
+            # keep running value, so initialize_dynamic_settings doesn't pick it up either
+            elif name in self.overrides:
+                overrides[name] = self.overrides[name]
+            else:
+                del overrides[name]
+        self.overrides = overrides
+        return sorted(changed)
+
+    def preset_values(self):
+        """
+        Settings applied over defaults, in JSON form that apply() accepts back.
+
+        Returns:
+            dict: Setting name to JSON value.
+        """
+        values = {}
+        for name, value in self.overrides.items():
+            if isinstance(value, Path):
+                value = str(value)
+            elif isinstance(value, tuple):
+                value = list(value)
+            values[name] = value
+        return values
+
+    def _validate(self, values, path):
+        """
+        Check preset values against type and range of defaults.
+        Paths are resolved relative to the package, lists become tuples.
+
+        Args:
+            values (dict): Setting name to raw JSON value.
+            path (str or Path): Where values came from, for error messages.
+
+        Returns:
+            dict: Setting name to converted value.
+
+        Raises:
+            ValueError: Listing every invalid setting.
+        """
+        errors = []
+        converted = {}
+        for name, value in values.items():
+            if name == 'preset_source' or name == 'overrides' or not hasattr(self, name):
+                errors.append(f'unknown setting {name!r}')
+                continue
+            default = getattr(self, name)
+            if isinstance(default, Path):
+                valid = isinstance(value, str)
+                value = BASE_DIR / value if valid else value
+            elif isinstance(default, tuple):
+                valid = (isinstance(value, list) and len(value) == len(default)
+                         and all(isinstance(part, int) and 0 <= part <= 255 for part in value))
+                value = tuple(value) if valid else value
+            elif isinstance(default, bool):
+                valid = isinstance(value, bool)
+            elif isinstance(default, (int, float)):
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if isinstance(default, int) and not isinstance(default, bool):
+                    valid = valid and float(value).is_integer()
+                    value = int(value) if valid else value
+                if valid and name not in CHOICES:
+                    valid = value >= 0 if name in NON_NEGATIVE else value > 0
+            else:
+                valid = isinstance(value, type(default))
+            if valid and name in CHOICES:
+                valid = value in CHOICES[name]
+            if not valid:
+                errors.append(f'invalid value for {name!r}: {value!r} (default {default!r})')
+                continue
+            converted[name] = value
+        if errors:
+            raise ValueError(f'{path}: ' + '; '.join(errors))
+        return converted
 
 
     #dynamic
     def initialize_dynamic_settings(self):
         """
-        Init dynamic settings: ship, bullet, fleet, alien points.
+        Init dynamic settings: ship, bullet, fleet speed and direction, alien points.
         """
         self.ship_speed = 5
         self.starting_ship_count = 3
@@ -69,11 +289,16 @@ class Settings:
         self.bullet_h = 80
         self.bullet_amount = 5
 
+        self.fleet_speed = 2
         self.fleet_direction = 1
         self.fleet_drop_speed = self.alien_h / 2
 
         self.alien_points = 50
 
+        for name in DYNAMIC_SETTINGS:
+            if name in self.overrides:
+                setattr(self, name, self.overrides[name])
+
     def increase_difficulty(self):
         """
         Scale ship, bullet, fleet speed by difficulty factor.
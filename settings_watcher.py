@@ -0,0 +1,62 @@
+"""
+Program Name: settings_watcher.py
+Author: Jack Curcillo
+Purpose: Reload settings preset when its file changes.
+Date: 11/14/2025
+"""
+
+import os
+from time import perf_counter
+
+
+class SettingsWatcher:
+    """
+    Polls modification time of settings preset and reloads it on change.
+    """
+    def __init__(self, settings, interval=1.0):
+        """
+        Init watcher: settings, poll interval, last seen modification time.
+
+        Args:
+            settings (Settings): Settings loaded from a preset.
+            interval (float): Seconds between file checks.
+        """
+        self.settings = settings
+        self.interval = interval
+        self.next_check = perf_counter() + interval
+        self.mtime = self._mtime()
+
+    def _mtime(self):
+        """
+        Returns:
+            int: Modification time of preset in ns, or None if missing.
+        """
+        try:
+            return os.stat(self.settings.preset_source).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """
+        Reload preset if interval has passed and file changed.
+        Invalid presets are reported and current settings kept.
+
+        Returns:
+            list: Names of settings that changed.
+        """
+        now = perf_counter()
+        if now < self.next_check:
+            return []
+        self.next_check = now + self.interval
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return []
+        self.mtime = mtime
+        try:
+            changed = self.settings.reload()
+        except (OSError, ValueError) as e:
+            print(f'Settings not reloaded: {e}')
+            return []
+        if changed:
+            print(f'Reloaded {self.settings.preset_source.name}: {", ".join(changed)}')
+        return changed
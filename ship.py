@@ -5,30 +5,31 @@ Purpose: Manage ship behavior.
 Date: 11/14/2025
 """
 
-import pygame
+from pygame import Rect
+from renderer import round_coord
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from alien_invasion import AlienInvasion
     from arsenal import Arsenal
 
 class Ship:
     """
-    Manage ship: movement, drawing, and firing.
+    Manage ship: movement and firing. Holds only position and movement
+    state; image and speed are kept by the game, which also draws it.
     """
-    def __init__(self, game: 'AlienInvasion', arsenal: 'Arsenal'):
-        """
-        Init ship: load image, set position, link arsenal.
-        """
-        self.game = game
-        self.settings = game.settings
-        self.screen = game.screen
-        self.boundaries = self.screen.get_rect()
+    __slots__ = ('boundaries', 'rect', 'x', 'prev_x', 'moving_right', 'moving_left', 'arsenal')
 
-        self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.ship_w, self.settings.ship_h))
+    def __init__(self, boundaries: Rect, size: tuple, arsenal: 'Arsenal'):
+        """
+        Init ship: set position, link arsenal.
 
-        self.rect = self.image.get_rect()
+        Args:
+            boundaries (pygame.Rect): Screen area ship moves in.
+            size (tuple): (w, h) of ship.
+            arsenal (Arsenal): Arsenal ship fires from.
+        """
+        self.boundaries = boundaries
+        self.rect = Rect((0, 0), size)
         self._center_ship()
         self.moving_right = False
         self.moving_left = False
@@ -40,32 +41,37 @@ class Ship:
         """
         self.rect.midbottom = self.boundaries.midbottom
         self.x = float(self.rect.x)
+        self.prev_x = self.x
 
-    def update(self):
-        """
-        Update ship position and bullets.
-        """
-        self._update_ship_movement()
-        self.arsenal.update_arsenal()
-
-    def _update_ship_movement(self):
+    def update(self, speed: float):
         """
         Move ship left/right.
+
+        Args:
+            speed (float): Distance to move this tick.
         """
-        temp_speed = self.settings.ship_speed
+        self.prev_x = self.x
         if self.moving_right and self.rect.right < self.boundaries.right:
-            self.x += temp_speed
+            self.x += speed
         if self.moving_left and self.rect.left > self.boundaries.left:
-            self.x -= temp_speed
+            self.x -= speed
         
         self.rect.x = self.x
 
-    def draw(self):
+    def draw_position(self, alpha=1.0):
         """
-        Draw ship and bullets.
+        Where to draw ship this frame.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
+
+        Returns:
+            pygame.Rect or tuple: Draw position.
         """
-        self.arsenal.draw()
-        self.screen.blit(self.image, self.rect)
+        if alpha == 1.0:
+            return self.rect
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        return (round_coord(x), self.rect.y)
 
     def fire(self):
         """
@@ -76,14 +82,17 @@ class Ship:
         """
         return self.arsenal.fire_bullet()
     
-    def check_collisions(self, other_group):
+    def check_collisions(self, alien_fleet):
         """
         Check collisions with aliens.
 
+        Args:
+            alien_fleet (AlienFleet): Fleet to check against.
+
         Returns:
             bool: True if collision, else False.
         """
-        if pygame.sprite.spritecollideany(self, other_group):
+        if alien_fleet.check_ship_collision(self):
             self._center_ship()
             return True
         return False
\ No newline at end of file
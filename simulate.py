@@ -0,0 +1,292 @@
+"""
+Program Name: simulate.py
+Author: Jack Curcillo
+Purpose: Play many headless games with bot policies across CPU cores and report difficulty curve.
+Date: 11/14/2025
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from argparse import ArgumentParser
+from multiprocessing import Pool
+from pathlib import Path
+from statistics import mean, median
+
+_game = None
+
+
+def sweep(game, tick, rng, memory):
+    """
+    Fire constantly, sweeping left and right with a random period per game.
+
+    Args:
+        game (AlienInvasion): Game being played.
+        tick (int): Ticks since game started.
+        rng (random.Random): Policy's own RNG, seeded per game.
+        memory (dict): Policy's state for this game.
+
+    Returns:
+        set: Actions to hold this tick: 'left', 'right', 'fire'.
+    """
+    period = memory.setdefault('period', rng.randint(40, 160))
+    return {'left', 'fire'} if (tick // period) % 2 else {'right', 'fire'}
+
+
+def camper(game, tick, rng, memory):
+    """
+    Walk to a random spot, then stay there and fire constantly.
+    """
+    if 'walk' not in memory:
+        memory['walk'] = rng.randint(0, 120)
+        memory['direction'] = rng.choice(('left', 'right'))
+    if tick < memory['walk']:
+        return {memory['direction'], 'fire'}
+    return {'fire'}
+
+
+def jitter(game, tick, rng, memory):
+    """
+    Pick random movement every 10 ticks, firing most of the time.
+    """
+    if tick % 10 == 0:
+        memory['inputs'] = set(rng.choice(((), ('left',), ('right',))))
+        if rng.random() < 0.8:
+            memory['inputs'].add('fire')
+    return memory['inputs']
+
+
+POLICIES = {
+    'sweep': sweep,
+    'camper': camper,
+    'jitter': jitter
+}
+
+
+def _init_worker(preset, overrides):
+    """
+    Build one headless game per worker process, reused for every game it plays.
+
+    Args:
+        preset (str): Settings preset name or file, or None.
+        overrides (dict): Settings to apply over preset.
+    """
+    global _game
+    # SDL's own SIGTERM handler would stop Pool.terminate from ending worker
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    from settings import Settings
+    from alien_invasion import AlienInvasion
+
+    settings = Settings(preset)
+    settings.apply(overrides, '--set')
+    with contextlib.redirect_stdout(io.StringIO()):
+        _game = AlienInvasion(headless=True, settings=settings)
+
+
+def play_game(job):
+    """
+    Play one game to the end, or to max_ticks, with a bot policy.
+
+    Args:
+        job (tuple): (seed, policy name, max_ticks).
+
+    Returns:
+        dict: seed, policy, score, level, ticks, play time, wall time, whether
+            game ended, and tick each level was reached and lives lost in each level.
+    """
+    seed, policy, max_ticks = job
+    game = _game
+    bot = POLICIES[policy]
+    rng = random.Random(seed)
+    memory = {}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.restart_game(seed=seed)
+        stats = game.game_stats
+        level_ticks = [0]
+        deaths = [0]
+        ships_left = stats.ships_left
+        tick = 0
+        active = True
+        while active and tick < max_ticks:
+            active = game.step(bot(game, tick, rng, memory))
+            tick += 1
+            if stats.level > len(level_ticks):
+                level_ticks.append(tick)
+                deaths.append(0)
+            if stats.ships_left < ships_left or not active:
+                deaths[-1] += 1
+            ships_left = stats.ships_left
+    return {
+        'seed': seed,
+        'policy': policy,
+        'score': stats.score,
+        'level': stats.level,
+        'ticks': tick,
+        'play_time': stats.play_time,
+        'wall_time': time.perf_counter() - start,
+        'game_over': not active,
+        'level_ticks': level_ticks,
+        'deaths': deaths
+    }
+
+
+def run_batch(games, policies=('sweep',), processes=None, max_ticks=36000, seed=0,
+              preset=None, overrides=None):
+    """
+    Play games split evenly across policies on a process pool, one process per core.
+
+    Args:
+        games (int): Games per policy.
+        policies (tuple): Policy names in POLICIES.
+        processes (int): Worker processes, or None for one per core.
+        max_ticks (int): Stop a game after this many ticks.
+        seed (int): Base seed; game i uses seed + i.
+        preset (str): Settings preset name or file, or None.
+        overrides (dict): Settings to apply over preset.
+
+    Returns:
+        list: Result of each game, see play_game.
+    """
+    jobs = [(seed + index, policy, max_ticks) for policy in policies for index in range(games)]
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (processes * 8))
+    with Pool(processes, _init_worker, (preset, overrides or {})) as pool:
+        results = list(pool.imap_unordered(play_game, jobs, chunksize))
+        pool.close()
+        pool.join()
+    return results
+
+
+def _percentile(values, fraction):
+    """
+    Nearest-rank percentile of sorted values.
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def aggregate(results):
+    """
+    Summarize games of each policy: score, level, duration, and per-level
+    survival (share of games reaching each level) and deaths.
+
+    Args:
+        results (list): Game results from run_batch.
+
+    Returns:
+        dict: Policy name to summary.
+    """
+    report = {}
+    for policy in sorted({result['policy'] for result in results}):
+        runs = [result for result in results if result['policy'] == policy]
+        scores = sorted(result['score'] for result in runs)
+        max_level = max(result['level'] for result in runs)
+        levels = []
+        for level in range(1, max_level + 1):
+            reached = [result for result in runs if result['level'] >= level]
+            cleared = [result for result in reached if result['level'] > level]
+            levels.append({
+                'level': level,
+                'survival': len(reached) / len(runs),
+                'deaths': sum(result['deaths'][level - 1] for result in reached),
+                'mean_ticks': mean(result['level_ticks'][level] - result['level_ticks'][level - 1]
+                                   for result in cleared) if cleared else None
+            })
+        report[policy] = {
+            'games': len(runs),
+            'finished': sum(result['game_over'] for result in runs),
+            'score_mean': mean(scores),
+            'score_median': median(scores),
+            'score_p90': _percentile(scores, 0.9),
+            'score_max': scores[-1],
+            'level_mean': mean(result['level'] for result in runs),
+            'level_max': max_level,
+            'play_time_mean': mean(result['play_time'] for result in runs),
+            'levels': levels
+        }
+    return report
+
+
+def _parse_overrides(pairs):
+    """
+    Turn NAME=VALUE pairs into settings values; VALUE is JSON, or a plain string.
+
+    Args:
+        pairs (list): 'name=value' strings.
+
+    Returns:
+        dict: Setting name to value.
+    """
+    overrides = {}
+    for pair in pairs:
+        name, _, value = pair.partition('=')
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+
+if __name__ == '__main__':
+    from settings import Settings
+
+    parser = ArgumentParser(description='Play many headless games with bots to tune difficulty.')
+    parser.add_argument('--games', '-n', type=int, default=100, help='games per policy')
+    parser.add_argument('--policy', action='append', choices=sorted(POLICIES),
+                        help='bot policy (repeatable, default sweep)')
+    parser.add_argument('--processes', '-j', type=int, help='worker processes (default one per core)')
+    parser.add_argument('--max-ticks', type=int, default=36000, help='stop each game after this many ticks')
+    parser.add_argument('--seed', type=int, default=0, help='base seed; game i uses seed + i')
+    parser.add_argument('--preset', help='settings preset name or .json file')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='override a setting, e.g. difficulty_scale=1.2 (repeatable)')
+    parser.add_argument('--output', '-o', default='simulation.json', help='JSON report file')
+    args = parser.parse_args()
+
+    overrides = _parse_overrides(args.set)
+    try:
+        Settings(args.preset).apply(overrides, '--set')
+    except (OSError, ValueError) as e:
+        sys.exit(f'Bad settings: {e}')
+
+    policies = tuple(args.policy or ('sweep',))
+    processes = args.processes or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = run_batch(args.games, policies, processes, args.max_ticks, args.seed, args.preset, overrides)
+    elapsed = time.perf_counter() - start
+    summary = aggregate(results)
+
+    for policy, stats in summary.items():
+        print(f"{policy}: {stats['games']} games, score mean {stats['score_mean']:.0f} "
+              f"p90 {stats['score_p90']}, level mean {stats['level_mean']:.2f} max {stats['level_max']}")
+        for level in stats['levels']:
+            ticks = f"{level['mean_ticks']:.0f}" if level['mean_ticks'] is not None else '-'
+            print(f"  level {level['level']:>3}  reached {level['survival']:6.1%}  "
+                  f"deaths {level['deaths']:>5}  ticks to clear {ticks:>6}")
+    print(f'{len(results)} games in {elapsed:.1f} s on {processes} processes '
+          f'({len(results) / elapsed:.1f} games/s)')
+
+    report = {
+        'meta': {
+            'games': args.games,
+            'policies': list(policies),
+            'processes': processes,
+            'max_ticks': args.max_ticks,
+            'seed': args.seed,
+            'preset': args.preset,
+            'overrides': overrides,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'elapsed': elapsed,
+            'time': time.time()
+        },
+        'summary': summary,
+        'results': sorted(results, key=lambda result: (result['policy'], result['seed']))
+    }
+    Path(args.output).write_text(json.dumps(report, indent = 4))
+    print(f'Wrote report to {args.output}', file=sys.stderr)
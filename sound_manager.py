@@ -0,0 +1,96 @@
+"""
+Program Name: sound_manager.py
+Author: Jack Curcillo
+Purpose: Load sound effects once and play them on reserved mixer channels.
+Date: 11/14/2025
+"""
+
+import threading
+from time import perf_counter
+import pygame
+
+
+class SoundManager:
+    """
+    Sound effects preloaded as decoded buffers, each with its own reserved channel.
+    Plays requested during a frame are coalesced and rate-limited per effect.
+    """
+    def __init__(self, settings, enabled=True):
+        """
+        Init effect table; mixer is not touched until load().
+
+        Args:
+            settings (Settings): Sound files, volume, and minimum interval.
+            enabled (bool): False to never init mixer or play anything.
+        """
+        self.settings = settings
+        self.enabled = enabled
+        # effect name to (file, fadeout ms)
+        self.effects = {
+            'laser': (settings.laser_sound, 300),
+            'impact': (settings.impact_sound, 500)
+        }
+        self.sounds = {}
+        self.channels = {}
+        self.last_played = {}
+        self.pending = set()
+        self.ready = False
+
+    def load_async(self):
+        """
+        Load sounds on a background thread, so startup does not wait on decoding.
+        Effects stay silent until loaded.
+        """
+        if self.enabled:
+            threading.Thread(target=self.load, name='SoundLoader', daemon=True).start()
+
+    def load(self):
+        """
+        Init mixer, decode every effect into memory and reserve a channel for each.
+        Sound is disabled if mixer or a file is unavailable.
+        """
+        if not self.enabled:
+            return
+        try:
+            pygame.mixer.init()
+            sounds = {}
+            for name, (path, _) in self.effects.items():
+                sounds[name] = pygame.mixer.Sound(path)
+                sounds[name].set_volume(self.settings.sound_volume)
+            pygame.mixer.set_reserved(len(sounds))
+            channels = {name: pygame.mixer.Channel(index) for index, name in enumerate(sounds)}
+        except (pygame.error, FileNotFoundError) as e:
+            print(f'Sound disabled: {e}')
+            self.enabled = False
+            return
+        self.sounds = sounds
+        self.channels = channels
+        self.ready = True
+
+    def play(self, name):
+        """
+        Request effect for this frame; repeated requests play it once.
+
+        Args:
+            name (str): Effect name, e.g. 'laser' or 'impact'.
+        """
+        if self.ready:
+            self.pending.add(name)
+
+    def flush(self):
+        """
+        Play effects requested this frame, skipping any played within sound_interval.
+        Each effect restarts on its own channel instead of taking a new one.
+        """
+        if not self.pending:
+            return
+        now = perf_counter()
+        interval = self.settings.sound_interval
+        for name in self.pending:
+            if now - self.last_played.get(name, -interval) < interval:
+                continue
+            self.last_played[name] = now
+            channel = self.channels[name]
+            channel.play(self.sounds[name])
+            channel.fadeout(self.effects[name][1])
+        self.pending.clear()
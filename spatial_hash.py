@@ -0,0 +1,112 @@
+"""
+Program Name: spatial_hash.py
+Author: Jack Curcillo
+Purpose: Uniform-grid index for fast collision lookups.
+Date: 11/14/2025
+"""
+
+from math import floor
+
+
+class SpatialHash:
+    """
+    Uniform grid of cells holding items by position.
+
+    Items are stored relative to a movable origin, so moving every
+    item by the same amount (a rigid fleet) is one origin update.
+    Items must be no larger than one cell.
+    """
+    def __init__(self, cell_w, cell_h):
+        """
+        Init empty grid.
+
+        Args:
+            cell_w (int): Width of one cell.
+            cell_h (int): Height of one cell.
+        """
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all items and reset origin.
+        """
+        self.cells = {}
+        self.item_cells = {}
+        self.origin_x = 0.0
+        self.origin_y = 0.0
+
+    def _cell(self, x, y):
+        """
+        Cell coordinates of a screen position.
+
+        Returns:
+            tuple: (col, row) of cell.
+        """
+        return (floor((x - self.origin_x) / self.cell_w), floor((y - self.origin_y) / self.cell_h))
+
+    def insert(self, item, rect):
+        """
+        Add item to cell containing its top-left corner.
+
+        Args:
+            item: Object to store.
+            rect (pygame.Rect): Current rect of item.
+        """
+        cell = self._cell(rect.x, rect.y)
+        self.cells.setdefault(cell, {})[item] = None
+        self.item_cells[item] = cell
+
+    def remove(self, item):
+        """
+        Remove item from grid, if present.
+
+        Args:
+            item: Object to remove.
+        """
+        cell = self.item_cells.pop(item, None)
+        if cell is None:
+            return
+        contents = self.cells[cell]
+        del contents[item]
+        if not contents:
+            del self.cells[cell]
+
+    def move(self, dx, dy):
+        """
+        Move every item in grid by same amount.
+
+        Args:
+            dx (float): Horizontal movement.
+            dy (float): Vertical movement.
+        """
+        self.origin_x += dx
+        self.origin_y += dy
+
+    def query(self, rect):
+        """
+        Find items in cells near rect.
+
+        Args:
+            rect (pygame.Rect): Area to search.
+
+        Returns:
+            list: Candidate items; caller still tests exact overlap.
+        """
+        left, top = self._cell(rect.left, rect.top)
+        right, bottom = self._cell(rect.right, rect.bottom)
+        cells = self.cells
+        found = []
+        for col in range(left - 1, right + 2):
+            for row in range(top - 1, bottom + 2):
+                contents = cells.get((col, row))
+                if contents:
+                    found.extend(contents)
+        return found
+
+    def __len__(self):
+        """
+        Number of items in grid.
+        """
+        return len(self.item_cells)
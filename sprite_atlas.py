@@ -0,0 +1,225 @@
+"""
+Program Name: sprite_atlas.py
+Author: Jack Curcillo
+Purpose: Pack sprites into one atlas image and slice them back out at runtime.
+Date: 11/14/2025
+"""
+
+import hashlib
+import json
+import math
+import os
+from argparse import ArgumentParser
+from pathlib import Path
+import pygame
+
+PADDING = 1
+
+
+def file_digest(path):
+    """
+    Args:
+        path (Path): File to hash.
+
+    Returns:
+        str: SHA-1 of file contents, in hex.
+    """
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def sprite_sizes(settings):
+    """
+    Sprites the game draws and the size it draws each at.
+
+    Args:
+        settings (Settings): Settings to read sprite files and sizes from.
+
+    Returns:
+        list: (path, (w, h)) pairs.
+    """
+    return [
+        (settings.ship_file, (settings.ship_w, settings.ship_h)),
+        (settings.bullet_file, (settings.bullet_w, settings.bullet_h)),
+        (settings.alien_file, (settings.alien_w, settings.alien_h))
+    ]
+
+
+def pack_rects(sizes, padding=PADDING):
+    """
+    Place rects on shelves, tallest first, in a roughly square sheet.
+
+    Args:
+        sizes (list): (w, h) of each rect.
+        padding (int): Empty pixels around each rect.
+
+    Returns:
+        tuple: ((sheet_w, sheet_h), list of (x, y) in same order as sizes).
+    """
+    area = sum((w + padding) * (h + padding) for w, h in sizes)
+    sheet_w = max([math.ceil(math.sqrt(area))] + [w + padding * 2 for w, _ in sizes])
+    positions = [None] * len(sizes)
+    x = y = padding
+    shelf_h = 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[index]
+        if x + w + padding > sheet_w:
+            x = padding
+            y += shelf_h + padding
+            shelf_h = 0
+        positions[index] = (x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return (sheet_w, y + shelf_h + padding), positions
+
+
+def pack_atlas(sprites, index_path, padding=PADDING):
+    """
+    Scale sprites to their draw size and pack them into one PNG plus JSON index.
+    Sprites are scaled the same way AssetCache scales them, so frames match.
+    Index records each source's path, byte size and hash, so stale entries can be skipped.
+
+    Args:
+        sprites (list): (path, (w, h)) pairs; duplicates are packed once.
+        index_path (Path): JSON index to write; PNG is written beside it.
+        padding (int): Empty pixels around each sprite.
+
+    Returns:
+        dict: Index written.
+    """
+    index_path = Path(index_path)
+    sprites = list(dict.fromkeys((Path(path).resolve(), tuple(size)) for path, size in sprites))
+    images = {}
+    sources = {}
+    surfaces = []
+    for path, size in sprites:
+        if path not in images:
+            images[path] = pygame.image.load(path)
+            sources[path] = {
+                'file': Path(os.path.relpath(path, index_path.parent.resolve())).as_posix(),
+                'bytes': path.stat().st_size,
+                'sha1': file_digest(path)
+            }
+        surface = pygame.transform.scale(images[path], size)
+        if surface.get_colorkey() is not None:
+            # turn colorkey into alpha, since sheet is copied with BLEND_RGBA_MAX
+            keyed = surface
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.blit(keyed, (0, 0))
+        surfaces.append(surface)
+
+    sheet_size, positions = pack_rects([size for _, size in sprites], padding)
+    sheet = pygame.Surface(sheet_size, pygame.SRCALPHA)
+    for surface, position in zip(surfaces, positions):
+        # max onto a clear sheet copies pixels exactly instead of alpha blending them
+        sheet.blit(surface, position, special_flags=pygame.BLEND_RGBA_MAX)
+    image_path = index_path.with_suffix('.png')
+    pygame.image.save(sheet, image_path)
+
+    index = {
+        'image': image_path.name,
+        'sprites': [
+            {**sources[path], 'rect': [x, y, w, h]}
+            for (path, (w, h)), (x, y) in zip(sprites, positions)
+        ]
+    }
+    index_path.write_text(json.dumps(index, indent = 4))
+    return index
+
+
+class SpriteAtlas:
+    """
+    One decoded atlas image; sprites are subsurfaces sharing its pixels.
+    """
+    def __init__(self, index_path):
+        """
+        Load atlas index and decode atlas image.
+
+        Args:
+            index_path (Path): JSON index written by pack_atlas.
+        """
+        index_path = Path(index_path)
+        index = json.loads(index_path.read_text())
+        self.sheet = pygame.image.load(index_path.parent / index['image'])
+        self.rects = {}
+        self.sources = {}
+        for sprite in index['sprites']:
+            path = (index_path.parent / sprite['file']).resolve()
+            self.rects[(path, tuple(sprite['rect'][2:]))] = pygame.Rect(sprite['rect'])
+            self.sources[path] = (sprite['bytes'], sprite['sha1'])
+        self.current = {}
+        self.converted = False
+
+    def __contains__(self, key):
+        """
+        Args:
+            key (tuple): (resolved file path, (w, h)).
+
+        Returns:
+            bool: True if atlas holds this sprite at this size, packed from
+                current contents of file.
+        """
+        return key in self.rects and self.is_current(key[0])
+
+    def is_current(self, path):
+        """
+        Check source file still matches what was packed. Checked once per file;
+        stale files are reported.
+
+        Args:
+            path (Path): Resolved source file.
+
+        Returns:
+            bool: True if file has same size and hash as when packed.
+        """
+        if path not in self.current:
+            size, digest = self.sources[path]
+            try:
+                current = path.stat().st_size == size and file_digest(path) == digest
+            except OSError:
+                current = False
+            if not current:
+                print(f'Sprite atlas out of date for {path.name}, loading file instead '
+                      f'(rebuild with sprite_atlas.py)')
+            self.current[path] = current
+        return self.current[path]
+
+    def convert(self):
+        """
+        Convert atlas image to display format once, if display exists.
+
+        Returns:
+            bool: True if atlas is in display format.
+        """
+        if not self.converted and pygame.display.get_surface() is not None:
+            self.sheet = self.sheet.convert_alpha()
+            self.converted = True
+        return self.converted
+
+    def get(self, key):
+        """
+        Slice one sprite out of atlas.
+
+        Args:
+            key (tuple): (resolved file path, (w, h)).
+
+        Returns:
+            pygame.Surface: Subsurface of atlas image.
+        """
+        return self.sheet.subsurface(self.rects[key])
+
+
+if __name__ == '__main__':
+    from settings import Settings
+
+    parser = ArgumentParser(description='Pack game sprites into one atlas image.')
+    parser.add_argument('--preset', action='append', default=[],
+                        help='also pack sprite sizes of this settings preset (repeatable)')
+    parser.add_argument('--output', '-o', help='JSON index to write (default: settings atlas_file)')
+    args = parser.parse_args()
+    settings = Settings()
+    sprites = sprite_sizes(settings)
+    for preset in args.preset:
+        sprites += sprite_sizes(Settings(preset))
+    output = Path(args.output) if args.output else settings.atlas_file
+    index = pack_atlas(sprites, output)
+    print(f'Packed {len(index["sprites"])} sprites into {output.with_suffix(".png")}')
@@ -0,0 +1,106 @@
+"""
+Program Name: text_cache.py
+Author: Jack Curcillo
+Purpose: Cache rendered text and glyphs.
+Date: 11/14/2025
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    Small LRU cache of rendered text keyed by (string, color, size).
+    """
+    def __init__(self, max_size=32):
+        """
+        Init empty cache.
+
+        Args:
+            max_size (int): Most rendered strings kept.
+        """
+        self.max_size = max_size
+        self.images = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, size, text, color):
+        """
+        Render text, reusing a cached surface when possible.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            size (int): Font size, part of cache key.
+            text (str): Text to render.
+            color (tuple): RGB text color.
+
+        Returns:
+            pygame.Surface: Rendered text.
+        """
+        key = (text, color, size)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = font.render(text, True, color, None)
+        self.images[key] = image
+        if len(self.images) > self.max_size:
+            self.images.popitem(last=False)
+        return image
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered character glyphs composed into strings with blits.
+    """
+    def __init__(self, font, color, chars='0123456789, '):
+        """
+        Init atlas: render starting characters once.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            color (tuple): RGB text color.
+            chars (str): Characters to pre-render.
+        """
+        self.font = font
+        self.color = color
+        self.glyphs = {}
+        self.height = font.get_height()
+        for char in chars:
+            self._glyph(char)
+
+    def _glyph(self, char):
+        """
+        Rendered glyph for char, rendering on first use.
+
+        Returns:
+            pygame.Surface: Glyph image.
+        """
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, self.color, None)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def render(self, text):
+        """
+        Compose text from glyphs.
+
+        Args:
+            text (str): Text to render.
+
+        Returns:
+            pygame.Surface: Rendered text.
+        """
+        glyphs = [self._glyph(char) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        image = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        current_x = 0
+        for glyph in glyphs:
+            image.blit(glyph, (current_x, 0))
+            current_x += glyph.get_width()
+        return image
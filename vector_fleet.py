@@ -0,0 +1,213 @@
+"""
+Program Name: vector_fleet.py
+Author: Jack Curcillo
+Purpose: Manage fleet of aliens as NumPy arrays.
+Date: 11/14/2025
+"""
+
+import numpy as np
+from alien_fleet import AlienFleet
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class VectorFleet(AlienFleet):
+    """
+    Alien fleet stored as contiguous x/y/alive arrays instead of sprites.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initialize the vectorized fleet. Aliens are added by create_fleet.
+
+        Args:
+            game ('AlienInvasion'): Reference to the main game instance.
+        """
+        self.empty_fleet()
+        super().__init__(game)
+
+    def _place_aliens(self, positions):
+        """
+        Add formation positions to arrays.
+
+        Args:
+            positions (tuple): (x, y) of each alien.
+        """
+        positions = np.array(positions, dtype=int).reshape(-1, 2)
+        self.x = np.concatenate((self.x, positions[:, 0]))
+        self.y = np.concatenate((self.y, positions[:, 1]))
+        self.base_x = np.concatenate((self.base_x, positions[:, 0]))
+        self.base_y = np.concatenate((self.base_y, positions[:, 1]))
+        self.alive = np.concatenate((self.alive, np.ones(len(positions), dtype=bool)))
+
+    def empty_fleet(self):
+        """
+        Remove all aliens.
+        """
+        self.x = np.empty(0, dtype=float)
+        self.y = np.empty(0, dtype=float)
+        self.base_x = np.empty(0, dtype=int)
+        self.base_y = np.empty(0, dtype=int)
+        self.alive = np.empty(0, dtype=bool)
+        self.last_move = (0, 0)
+        self.layer = None
+
+    @staticmethod
+    def _round(values):
+        """
+        Round to integers like pygame.Rect does: halves away from zero.
+
+        Args:
+            values (np.ndarray): Float coordinates.
+
+        Returns:
+            np.ndarray: Integer coordinates.
+        """
+        return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(int)
+
+    def _rects(self):
+        """
+        Integer rect edges of living aliens, rounded like pygame.Rect.
+
+        Returns:
+            tuple: (indices, left, top) arrays.
+        """
+        indices = np.flatnonzero(self.alive)
+        left = self._round(self.x[indices])
+        top = self._round(self.y[indices])
+        return indices, left, top
+
+    def _check_fleet_edges(self):
+        """
+        Drop and reverse fleet when any alien hits edge.
+        """
+        _, left, _ = self._rects()
+        if len(left) == 0:
+            return
+        if left.min() <= 0 or left.max() + self.settings.alien_w >= self.settings.screen_w:
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
+
+    def _drop_alien_fleet(self):
+        """
+        Move fleet down by fleet_drop_speed.
+        """
+        self.y += self.fleet_drop_speed
+        self.last_move = (self.last_move[0], self.fleet_drop_speed)
+
+    def update_fleet(self, scale=1.0):
+        """
+        Update fleet position, checking edges and moving
+        fleet in current direction.
+
+        Args:
+            scale (float): Tick length relative to a BASE_RATE tick.
+        """
+        self.last_move = (0, 0)
+        self._check_fleet_edges()
+        dx = self.settings.fleet_speed * scale * self.fleet_direction
+        self.x += dx
+        self.last_move = (dx, self.last_move[1])
+
+    def draw(self, alpha=1.0):
+        """
+        Draw all living aliens to screen.
+
+        Args:
+            alpha (float): Interpolation between previous and current tick.
+        """
+        offset = self._draw_offset(alpha)
+        if self.settings.fleet_layer:
+            self._draw_layer(offset)
+            return
+        _, left, top = self._rects()
+        if offset:
+            left = left + offset[0]
+            top = top + offset[1]
+        image = self.image
+        self.renderer.blits([(image, pos) for pos in zip(left.tolist(), top.tolist())])
+
+    def _base_positions(self):
+        """
+        Returns:
+            list: (x, y) creation position of each living alien.
+        """
+        return list(zip(self.base_x[self.alive].tolist(), self.base_y[self.alive].tolist()))
+
+    def _fleet_shift(self):
+        """
+        Distance fleet has moved since creation.
+
+        Returns:
+            tuple: (dx, dy) in whole pixels.
+        """
+        index = int(np.argmax(self.alive))
+        x, y = self._round(np.array((self.x[index], self.y[index])))
+        return (int(x) - int(self.base_x[index]), int(y) - int(self.base_y[index]))
+
+    def _overlaps(self, left, top, rect):
+        """
+        Check overlap of alien rects with one rect, like Rect.colliderect.
+
+        Returns:
+            np.ndarray: Bool mask over given aliens.
+        """
+        return ((left < rect.right) & (rect.left < left + self.settings.alien_w)
+                & (top < rect.bottom) & (rect.top < top + self.settings.alien_h))
+
+    def check_collisions(self, arsenal):
+        """
+        Check for projectile hits, removing hit aliens and bullets.
+
+        Args:
+            arsenal (Arsenal): Bullets in flight to check collisions against.
+
+        Returns:
+            dict: Alien index to list of bullets, like pygame.sprite.groupcollide.
+        """
+        collisions = {}
+        if not arsenal.arsenal:
+            return collisions
+        indices, left, top = self._rects()
+        for bullet in list(arsenal.arsenal):
+            hits = indices[self._overlaps(left, top, bullet.rect)]
+            if len(hits):
+                collisions.setdefault(int(hits[0]), []).append(bullet)
+                arsenal.remove(bullet)
+        if collisions:
+            self.alive[list(collisions)] = False
+            self.layer = None
+        return collisions
+
+    def check_ship_collision(self, ship):
+        """
+        Check if any alien overlaps ship.
+
+        Args:
+            ship (Ship): Ship to check.
+
+        Returns:
+            bool: True if collision, else False.
+        """
+        _, left, top = self._rects()
+        return bool(self._overlaps(left, top, ship.rect).any())
+
+    def check_fleet_bottom(self):
+        """
+        Check if any alien has reached bottom of screen.
+
+        Returns:
+            bool: True if alien reached bottom, else False.
+        """
+        _, _, top = self._rects()
+        return bool((top + self.settings.alien_h >= self.settings.screen_h).any())
+
+    def check_destroyed_status(self):
+        """
+        Check if all aliens were destroyed.
+
+        Returns:
+            bool: True if no aliens alive, else False.
+        """
+        return not self.alive.any()